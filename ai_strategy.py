@@ -1,3 +1,4 @@
+import importlib.util
 import pandas as pd
 import numpy as np
 import talib
@@ -5,27 +6,11 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, precision_score, recall_score, classification_report
 from typing import Dict, List, Tuple
 
-# XGBoost is disabled on macOS due to libomp compatibility issues
-XGBOOST_AVAILABLE = False
-XGBClassifier = None
-# If you want to re-enable XGBoost, uncomment below:
-# try:
-#     from xgboost import XGBClassifier as _XGBClassifier
-#     XGBClassifier = _XGBClassifier
-#     XGBOOST_AVAILABLE = True
-# except Exception as e:
-#     print(f"Warning: XGBoost not available: {e}")
-
-# LightGBM is disabled on macOS due to libomp compatibility issues
-LIGHTGBM_AVAILABLE = False
-LGBMClassifier = None
-# If you want to re-enable LightGBM, uncomment below:
-# try:
-#     from lightgbm import LGBMClassifier as _LGBMClassifier
-#     LGBMClassifier = _LGBMClassifier
-#     LIGHTGBM_AVAILABLE = True
-# except Exception as e:
-#     print(f"Warning: LightGBM not available: {e}")
+# Availability is probed cheaply with find_spec; the actual native imports
+# happen lazily in _make_model the first time those models are selected.
+# (On macOS both need libomp - see install_lightgbm.sh)
+XGBOOST_AVAILABLE = importlib.util.find_spec('xgboost') is not None
+LIGHTGBM_AVAILABLE = importlib.util.find_spec('lightgbm') is not None
 
 class AIStrategy:
     def __init__(self, model_type: str = 'random_forest', n_estimators: int = 100, max_depth: int = 10):
@@ -35,43 +20,51 @@ class AIStrategy:
         n_estimators: Number of trees/estimators
         max_depth: Maximum depth of trees
         """
-        from sklearn.linear_model import LogisticRegression
-        from sklearn.svm import SVC
-        from sklearn.ensemble import VotingClassifier
-        
         self.model_type = model_type
         self.n_estimators = n_estimators
         self.max_depth = max_depth
-        
-        if model_type == 'xgboost' and XGBOOST_AVAILABLE and XGBClassifier is not None:
-            self.model = XGBClassifier(
-                n_estimators=n_estimators,
-                max_depth=max_depth,
+        self.model = self._make_model()
+        self.feature_cols = []
+
+    def _make_model(self):
+        """
+        Construct a fresh estimator for the configured model_type.
+        xgboost/lightgbm are imported here, on first use, so selecting
+        Random Forest never pays their native-library load time.
+        """
+        if self.model_type == 'xgboost' and XGBOOST_AVAILABLE:
+            from xgboost import XGBClassifier
+            return XGBClassifier(
+                n_estimators=self.n_estimators,
+                max_depth=self.max_depth,
                 learning_rate=0.1,
                 random_state=42,
                 use_label_encoder=False,
                 eval_metric='logloss'
             )
-        elif model_type == 'lightgbm' and LIGHTGBM_AVAILABLE and LGBMClassifier is not None:
-            self.model = LGBMClassifier(
-                n_estimators=n_estimators,
-                max_depth=max_depth,
+        elif self.model_type == 'lightgbm' and LIGHTGBM_AVAILABLE:
+            from lightgbm import LGBMClassifier
+            return LGBMClassifier(
+                n_estimators=self.n_estimators,
+                max_depth=self.max_depth,
                 learning_rate=0.1,
                 random_state=42,
                 verbose=-1
             )
-        elif model_type == 'ensemble':
+        elif self.model_type == 'ensemble':
             # Ensemble: RF + Logistic Regression + SVC with soft voting
-            rf = RandomForestClassifier(n_estimators=n_estimators, max_depth=max_depth, random_state=42)
+            from sklearn.linear_model import LogisticRegression
+            from sklearn.svm import SVC
+            from sklearn.ensemble import VotingClassifier
+            rf = RandomForestClassifier(n_estimators=self.n_estimators, max_depth=self.max_depth, random_state=42)
             lr = LogisticRegression(max_iter=1000, random_state=42)
             svc = SVC(probability=True, random_state=42)
-            self.model = VotingClassifier(
+            return VotingClassifier(
                 estimators=[('rf', rf), ('lr', lr), ('svc', svc)],
                 voting='soft'
             )
         else:
-            self.model = RandomForestClassifier(n_estimators=n_estimators, max_depth=max_depth, random_state=42)
-        self.feature_cols = []
+            return RandomForestClassifier(n_estimators=self.n_estimators, max_depth=self.max_depth, random_state=42)
 
     def fetch_fear_and_greed(self, limit: int = 500) -> pd.DataFrame:
         """
@@ -292,20 +285,7 @@ class AIStrategy:
             y_test = test_df['Target']
             
             # Train fresh model for each window (using stored hyperparameters)
-            if self.model_type == 'xgboost' and XGBOOST_AVAILABLE and XGBClassifier is not None:
-                model = XGBClassifier(n_estimators=self.n_estimators, max_depth=self.max_depth, learning_rate=0.1, random_state=42, use_label_encoder=False, eval_metric='logloss')
-            elif self.model_type == 'lightgbm' and LIGHTGBM_AVAILABLE and LGBMClassifier is not None:
-                model = LGBMClassifier(n_estimators=self.n_estimators, max_depth=self.max_depth, learning_rate=0.1, random_state=42, verbose=-1)
-            elif self.model_type == 'ensemble':
-                from sklearn.linear_model import LogisticRegression
-                from sklearn.svm import SVC
-                from sklearn.ensemble import VotingClassifier
-                rf = RandomForestClassifier(n_estimators=self.n_estimators, max_depth=self.max_depth, random_state=42)
-                lr = LogisticRegression(max_iter=1000, random_state=42)
-                svc = SVC(probability=True, random_state=42)
-                model = VotingClassifier(estimators=[('rf', rf), ('lr', lr), ('svc', svc)], voting='soft')
-            else:
-                model = RandomForestClassifier(n_estimators=self.n_estimators, max_depth=self.max_depth, random_state=42)
+            model = self._make_model()
             
             model.fit(X_train, y_train)
             
@@ -355,7 +335,7 @@ class AIStrategy:
         
         # Loop Backtest
         capital = initial_capital
-        equity = []
+        equity = np.empty(len(df), dtype=np.float64)
         position = 0  # 0: None, 1: Long, -1: Short
         entry_price = 0
         horizon = 4  # Assumed from label generation
@@ -388,7 +368,7 @@ class AIStrategy:
                     entry_price = df['close'].iloc[i]
                     exit_idx = i + horizon
             
-            equity.append(capital)
+            equity[i] = capital
             
         df['Equity'] = equity
         
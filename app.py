@@ -1,14 +1,49 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go # [新增] 用于画双轴图
 from plotly.subplots import make_subplots # [新增]
 import yfinance as yf # [新增]
 import time
 import os  # [NEW] For file path operations
+import re
+from collections import Counter
+from operator import itemgetter
 from datetime import datetime, timedelta
 from streamlit_echarts import st_echarts
 
+# 预编译: 从 LLM 叙事摘要中提取 AI Score 的正则 (Tab 9)
+_AI_SCORE_RE = re.compile(r"\*\*🎯 AI Score\*\*:?\s*([-\d\.]+)")
+
+# Tab 11: 静态 Plotly 布局模板 (每次重绘只更新动态 title)
+_EQUITY_LAYOUT = go.Layout(xaxis_title="Time", yaxis_title="Equity ($)")
+_SIGNAL_LAYOUT = go.Layout(title="Price & AI Signals (Long/Short)", xaxis_title="Time", yaxis_title="Price")
+
+# Tab 10: 新闻情感图标/标签映射 (常量, 不必每次点击重建)
+_SENTIMENT_ICONS = {"negative": "🔴", "positive": "🟢", "neutral": "⚪"}
+_SENTIMENT_LABELS = {"negative": "负面", "positive": "正面", "neutral": "中性"}
+
+
+def _confusion_matrix_html(cm) -> str:
+    """Tab 11: 2x2 混淆矩阵的静态 HTML 表格 (4 个数字不值得一张 Plotly 热力图)"""
+    tn, fp, fn, tp = (int(v) for v in cm.ravel())
+    peak = max(tn, fp, fn, tp, 1)
+
+    def cell(v):
+        alpha = 0.15 + 0.75 * v / peak
+        return (f"<td style='text-align:center;padding:14px;font-size:1.2em;"
+                f"background:rgba(31,119,180,{alpha:.2f})'>{v}</td>")
+
+    return (
+        "<table style='width:100%;border-collapse:collapse'>"
+        "<tr><th></th><th colspan='2' style='padding:6px'>Predicted</th></tr>"
+        "<tr><th></th><th style='padding:6px'>Down (0)</th><th style='padding:6px'>Up (1)</th></tr>"
+        f"<tr><th style='padding:6px'>Actual Down (0)</th>{cell(tn)}{cell(fp)}</tr>"
+        f"<tr><th style='padding:6px'>Actual Up (1)</th>{cell(fn)}{cell(tp)}</tr>"
+        "</table>"
+    )
+
 
 # --- 导入模块 ---
 try:
@@ -19,7 +54,7 @@ try:
     from market_sentiment import MarketSentimentMonitor # <--- 新增这行
     from quant_agent import CryptoQuantAgent # <--- 新增这行
     from agents.launcher import run_multi_agent_analysis # [NEW] Multi-Agent Launcher
-    from sentiment.reddit_sentiment import RedditSentimentAnalyzer # [NEW] Reddit Sentiment
+    from sentiment.reddit_sentiment import RedditSentimentAnalyzer, RedditPost # [NEW] Reddit Sentiment
 except ImportError as e:
     st.error(f"❌ 导入脚本失败: {e}")
     st.stop()
@@ -88,7 +123,75 @@ def load_exchange_data():
 @st.cache_data(ttl=300)
 def load_depeg_data():
     monitor = DepegMonitor()
-    return monitor.analyze_pegs()
+    # analyze_pegs 返回 list[dict]; 只在这层 (展示入口) 物化为 DataFrame
+    return monitor.to_dataframe()
+
+
+@st.cache_resource
+def get_backtest_engine():
+    """Tab 8/11: 共享的 BacktestEngine 实例 (重跑不再重建 ccxt 连接)"""
+    from backtest_engine import BacktestEngine
+    return BacktestEngine()
+
+
+@st.cache_resource
+def get_ai_strategy(model_key: str, n_estimators: int, max_depth: int):
+    """Tab 11: 按超参数缓存的 AIStrategy 实例"""
+    from ai_strategy import AIStrategy
+    return AIStrategy(model_type=model_key, n_estimators=n_estimators, max_depth=max_depth)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_ohlcv(symbol: str, timeframe: str, limit: int):
+    """Tab 11: OHLCV 行情缓存 (相同参数 5 分钟内不再请求交易所)"""
+    df = get_backtest_engine().fetch_data(symbol, timeframe, limit=limit)
+    if df is not None:
+        # float32 对价格预测精度足够, 下游指标计算和模型训练的内存占用减半
+        cols = ['open', 'high', 'low', 'close', 'volume']
+        df[cols] = df[cols].astype(np.float32)
+    return df
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_reddit_posts(subreddit: str, filter_type: str, count: int, time_range):
+    """Tab 7: Reddit 帖子抓取 (5 分钟缓存, 只缓存可序列化的 dict)"""
+    analyzer = RedditSentimentAnalyzer()
+    posts = analyzer.scrape_reddit_posts(
+        subreddit=subreddit,
+        filter_type=filter_type,
+        count=count,
+        time_range=time_range
+    )
+    # st.cache_data pickles the return value, so hand back plain dicts
+    # instead of RedditPost objects; callers rebuild them cheaply
+    return [
+        {
+            'id': p.id, 'title': p.title, 'selftext': p.selftext,
+            'ups': p.upvotes, 'num_comments': p.num_comments,
+            'created_utc': p.created_utc,
+            'permalink': p.url.replace('https://reddit.com', '')
+        }
+        for p in posts
+    ]
+
+
+@st.cache_resource
+def get_twitter_analyzer(cookies_path: str):
+    """Tab 9: 跨重跑复用的 Twitter 分析器 (twikit 会话 + BERT 模型按需加载一次)"""
+    from sentiment.twitter_sentiment import TwitterSentimentAnalyzer
+    return TwitterSentimentAnalyzer()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_narrative_summary(tweets_hash: str, provider: str, model_name: str, _tweets, _analyzer, _api_key, _base_url):
+    """Tab 9: LLM 叙事摘要缓存 (按推文 ID 哈希命中, API Key 不参与缓存键)"""
+    return _analyzer.generate_narrative_summary(
+        _tweets,
+        api_key=_api_key,
+        provider=provider,
+        base_url=_base_url,
+        model_name=model_name
+    )
 
 
 @st.cache_data(ttl=600)
@@ -1178,13 +1281,9 @@ with tab7:
                 if filter_type == "top" and time_range:
                     st.info(f"⏰ 时间范围: {time_range}")
                 
-                # Scrape posts directly (now uses Selenium)
-                posts = analyzer.scrape_reddit_posts(
-                    subreddit='CryptoCurrency',
-                    filter_type=filter_type,
-                    count=post_limit,
-                    time_range=time_range
-                )
+                # Scrape posts (cached 5 min so repeat clicks skip the network fetch)
+                post_dicts = load_reddit_posts('CryptoCurrency', filter_type, post_limit, time_range)
+                posts = [RedditPost(d) for d in post_dicts]
                 
                 if not posts:
                     st.warning("⚠️ 未能抓取到帖子 (Failed to fetch posts)")
@@ -1196,18 +1295,19 @@ with tab7:
                 else:
                     # Analyze sentiments
                     posts = analyzer.analyze_posts(posts)
-                    
-                    # Store in session state
+
+                    # Store in session state; the tab only renders
+                    # display_snippet, so drop the full bodies (which can be
+                    # thousands of chars each) before they sit in state
+                    for p in posts:
+                        p.selftext = ''
                     st.session_state['reddit_posts'] = posts
                     st.session_state['analyzer'] = analyzer
                     
                     st.success(f"✅ 成功分析 {len(posts)} 条帖子")
                     
             except Exception as e:
-                st.error(f"❌ 错误: {str(e)}")
-                import traceback
-                with st.expander("查看错误堆栈"):
-                    st.code(traceback.format_exc())
+                st.exception(e)
     
     # Display Results
     if 'reddit_posts' in st.session_state and st.session_state['reddit_posts']:
@@ -1306,8 +1406,8 @@ with tab7:
             for i, post in enumerate(top_negative, 1):
                 with st.expander(f"#{i} - Sentiment: {post.sentiment_scores['compound']:.3f}"):
                     st.markdown(f"**{post.title}**")
-                    if post.selftext:
-                        st.markdown(f"> {post.selftext[:200]}...")
+                    if post.display_snippet:
+                        st.markdown(f"> {post.display_snippet}...")
                     col_p1, col_p2, col_p3 = st.columns(3)
                     with col_p1:
                         st.metric("Upvotes", post.upvotes)
@@ -1321,8 +1421,8 @@ with tab7:
             for i, post in enumerate(top_positive, 1):
                 with st.expander(f"#{i} - Sentiment: {post.sentiment_scores['compound']:.3f}"):
                     st.markdown(f"**{post.title}**")
-                    if post.selftext:
-                        st.markdown(f"> {post.selftext[:200]}...")
+                    if post.display_snippet:
+                        st.markdown(f"> {post.display_snippet}...")
                     col_p1, col_p2, col_p3 = st.columns(3)
                     with col_p1:
                         st.metric("Upvotes", post.upvotes)
@@ -1376,6 +1476,13 @@ with tab7:
                     if "error" in res:
                         st.error(res['error'])
                     else:
+                        # Store the OHLCV frame as an Arrow table: columnar
+                        # buffers pickle far smaller between reruns than pandas
+                        try:
+                            import pyarrow as pa
+                            res['df'] = pa.Table.from_pandas(res['df'])
+                        except ImportError:
+                            pass
                         st.session_state['bt_results'] = res
                         st.success(f"Backtest Complete! Analyzed {res['data_points']} candles.")
                         
@@ -1386,13 +1493,19 @@ with tab7:
         if 'bt_results' in st.session_state:
             res = st.session_state['bt_results']
             
+            # Rehydrate the Arrow table back to pandas once per render
+            # (column buffers are shared, so this is effectively zero-copy)
+            df_bt = res['df']
+            if not isinstance(df_bt, pd.DataFrame):
+                df_bt = df_bt.to_pandas()
+            
             # Validation: Check if the cached results have the new PnL keys AND the new MACD column
             # If not (stale data), clear session state and stop rendering
             first_key = list(res['results'].keys())[0]
             if ('Total Return' not in res['results'][first_key] or 
                 'Total Signals' not in res['results'][first_key] or 
-                'MACD_Signal_Line' not in res['df'].columns or
-                'WillR_EMA' not in res['df'].columns):
+                'MACD_Signal_Line' not in df_bt.columns or
+                'WillR_EMA' not in df_bt.columns):
                 del st.session_state['bt_results']
                 st.warning("⚠️ Backtest engine updated. Please click 'Run Backtest' again to generate new PnL metrics.")
                 st.stop()
@@ -1406,13 +1519,15 @@ with tab7:
             results = res['results']
             rows = []
             for ind, metrics in results.items():
+                # Keep the percentages numeric; Styler.format renders the
+                # '%' suffix at display time so styling never re-parses strings
                 rows.append({
                     "Indicator": ind,
-                    "Total Return (PnL)": f"{metrics['Total Return']}%",
-                    "Max Drawdown": f"{metrics['Max Drawdown']}%",
-                    "Win Rate (Total)": f"{metrics['Win Rate']}%",
-                    "Buy Win Rate": f"{metrics['Buy Win Rate']}%",
-                    "Sell Win Rate": f"{metrics['Sell Win Rate']}%",
+                    "Total Return (PnL)": metrics['Total Return'],
+                    "Max Drawdown": metrics['Max Drawdown'],
+                    "Win Rate (Total)": metrics['Win Rate'],
+                    "Buy Win Rate": metrics['Buy Win Rate'],
+                    "Sell Win Rate": metrics['Sell Win Rate'],
                     "Buy Signals": metrics['Buy Signals'],
                     "Sell Signals": metrics['Sell Signals'],
                     "Total Signals": metrics['Buy Signals'] + metrics['Sell Signals']
@@ -1435,14 +1550,15 @@ with tab7:
             
             # Display Table with highlighting
             st.markdown("### 📊 Indicator Performance Matrix")
+            pct_cols = ['Total Return (PnL)', 'Max Drawdown', 'Win Rate (Total)', 'Buy Win Rate', 'Sell Win Rate']
             st.dataframe(
-                df_res.style.applymap(
-                    lambda x: 'color: green' if float(x.strip('%')) > 0 else 'color: red',
+                df_res.style.apply(
+                    lambda s: np.where(s > 0, 'color: green', 'color: red'),
                     subset=['Total Return (PnL)']
-                ).applymap(
-                    lambda x: 'color: green' if float(x.strip('%')) > 50 else 'color: red',
+                ).apply(
+                    lambda s: np.where(s > 50, 'color: green', 'color: red'),
                     subset=['Win Rate (Total)']
-                ),
+                ).format('{:.2f}%', subset=pct_cols),
                 use_container_width=True
             )
             
@@ -1461,7 +1577,7 @@ with tab7:
             sl_val = res.get('stop_loss', 0.02)
             tp_val = res.get('take_profit', 0.04)
             ts_val = res.get('trailing_stop', 0.0)
-            df_viz = engine.calculate_pnl_curve(res['df'], viz_ind, horizon=res['horizon'], stop_loss=sl_val, take_profit=tp_val, trailing_stop=ts_val)
+            df_viz = engine.calculate_pnl_curve(df_bt, viz_ind, horizon=res['horizon'], stop_loss=sl_val, take_profit=tp_val, trailing_stop=ts_val)
             
             # 1. Candlestick Chart with Signals AND Indicator Subplot
             from plotly.subplots import make_subplots
@@ -1472,13 +1588,14 @@ with tab7:
                                 subplot_titles=(f"{res['symbol']} Price & Signals", f"{viz_ind} Indicator"))
             
             # --- Row 1: Price & Signals ---
-            # Candlestick
+            # Candlestick (feed NumPy views so Plotly skips the Series->list conversion)
+            viz_np = {c: df_viz[c].to_numpy() for c in ('timestamp', 'open', 'high', 'low', 'close')}
             fig.add_trace(go.Candlestick(
-                x=df_viz['timestamp'],
-                open=df_viz['open'],
-                high=df_viz['high'],
-                low=df_viz['low'],
-                close=df_viz['close'],
+                x=viz_np['timestamp'],
+                open=viz_np['open'],
+                high=viz_np['high'],
+                low=viz_np['low'],
+                close=viz_np['close'],
                 name='Price'
             ), row=1, col=1)
 
@@ -1556,8 +1673,8 @@ with tab7:
             
             # Strategy Equity
             fig_pnl.add_trace(go.Scatter(
-                x=df_viz['timestamp'],
-                y=df_viz['Equity'],
+                x=viz_np['timestamp'],
+                y=df_viz['Equity'].to_numpy(),
                 mode='lines',
                 name=f'{viz_ind} Strategy',
                 line=dict(color='gold', width=2)
@@ -1744,9 +1861,10 @@ with tab7:
                 with st.spinner("Fetching tweets and analyzing sentiment (Loading AI models)..."):
                     try:
                         import asyncio
-                        from sentiment.twitter_sentiment import TwitterSentimentAnalyzer
                         
-                        analyzer = TwitterSentimentAnalyzer()
+                        # Cached resource: the twikit session and loaded BERT
+                        # models survive reruns instead of re-initializing per click
+                        analyzer = get_twitter_analyzer(cookies_path)
                         
                         # Run async fetch
                         tweets = asyncio.run(analyzer.fetch_tweets(query, tweet_count))
@@ -1761,12 +1879,20 @@ with tab7:
                             narrative_summary = None
                             if t_api_key:
                                 with st.spinner("🤖 Generating AI Narrative Summary..."):
-                                    narrative_summary = analyzer.generate_narrative_summary(
-                                        tweets, 
-                                        api_key=t_api_key,
-                                        provider="DeepSeek-V3" if "DeepSeek" in t_ai_provider else "OpenAI",
-                                        base_url=t_base_url,
-                                        model_name=t_model
+                                    # Same tweet batch + model within the hour hits the cache
+                                    import hashlib
+                                    import json
+                                    tweets_hash = hashlib.md5(
+                                        json.dumps(sorted(str(t.get('id', '')) for t in tweets)).encode()
+                                    ).hexdigest()
+                                    narrative_summary = load_narrative_summary(
+                                        tweets_hash,
+                                        "DeepSeek-V3" if "DeepSeek" in t_ai_provider else "OpenAI",
+                                        t_model,
+                                        tweets,
+                                        analyzer,
+                                        t_api_key,
+                                        t_base_url
                                     )
                             
                             # Display Results
@@ -1780,7 +1906,8 @@ with tab7:
                             m1, m2, m3 = st.columns(3)
                             m1.metric("Sentiment Score", f"{result['score']:.2f}", delta=result['label'])
                             m2.metric("Tweets Analyzed", result['count'])
-                            m3.metric("Dominant Emotion", max(result['distribution'], key=result['distribution'].get))
+                            dominant_emotion = max(result['distribution'].items(), key=itemgetter(1))[0]
+                            m3.metric("Dominant Emotion", dominant_emotion)
                             
                             # Model Breakdown
                             with st.expander("🧠 Model Score Breakdown (Details)", expanded=False):
@@ -1789,8 +1916,7 @@ with tab7:
                                 # Extract AI Score if available
                                 ai_score = None
                                 if narrative_summary:
-                                    import re
-                                    match = re.search(r"\*\*🎯 AI Score\*\*:?\s*([-\d\.]+)", narrative_summary)
+                                    match = _AI_SCORE_RE.search(narrative_summary)
                                     if match:
                                         try:
                                             ai_score = float(match.group(1))
@@ -1819,20 +1945,28 @@ with tab7:
                                          color_discrete_map={'Positive':'#00cc96', 'Neutral':'#636efa', 'Negative':'#ef553b'})
                             st.plotly_chart(fig, use_container_width=True)
                             
-                            # Top Tweets
+                            # Top Tweets (single dataframe widget instead of one expander per tweet)
                             st.markdown("### 📝 Recent Tweets")
-                            for tweet in tweets[:5]:
-                                with st.expander(f"@{tweet['screen_name']} - {tweet['created_at']}"):
-                                    st.write(tweet['text'])
-                                    st.caption(f"❤️ {tweet['likes']} | 🔄 {tweet['retweets']}")
+                            df_tweets = pd.DataFrame(tweets[:5])[['screen_name', 'created_at', 'text', 'likes', 'retweets']]
+                            st.dataframe(
+                                df_tweets,
+                                use_container_width=True,
+                                hide_index=True,
+                                column_config={
+                                    "screen_name": "User",
+                                    "created_at": "Time",
+                                    "text": st.column_config.TextColumn("Tweet", width="large"),
+                                    "likes": "❤️",
+                                    "retweets": "🔄",
+                                }
+                            )
                                     
                     except Exception as e:
-                        st.error(f"❌ Error: {str(e)}")
-                        import traceback
-                        st.code(traceback.format_exc())
+                        st.exception(e)
             
             if st.button("🚪 Logout (Delete Cookies)"):
                 os.remove(cookies_path)
+                get_twitter_analyzer.clear()  # Drop the cached session along with the cookies
                 st.success("Logged out.")
                 st.rerun()
 
@@ -1876,179 +2010,180 @@ with tab10:
     if st.button("🔍 分析项目风险 (Analyze Risk)", type="primary"):
         with st.spinner("正在分析项目合规风险..."):
             try:
-                from risk.compliance_risk import analyze_project_compliance
+                from risk.compliance_risk import analyze_project_compliance, iter_regulatory_news
+                
+                # The score/GitHub/audit report needs the complete news list,
+                # so it fills this container after the news stream finishes
+                report_area = st.container()
+                
+                # --- News Section (streamed as each feed is parsed) ---
+                news_header = st.empty()
+                news_header.subheader("📰 相关新闻 (Recent News) - 抓取中...")
+                ncol1, ncol2, ncol3 = st.columns(3)
+                neg_slot, pos_slot, neu_slot = ncol1.empty(), ncol2.empty(), ncol3.empty()
+                news_area = st.container()
+                
+                news_items = []
+                counts = Counter()
+                has_project_specific = False
+                for news in iter_regulatory_news(cr_project):
+                    news_items.append(news)
+                    counts[news.sentiment] += 1
+                    has_project_specific |= news.is_project_specific
+                    
+                    news_header.subheader(f"📰 相关新闻 (Recent News) - {len(news_items)} 条")
+                    if counts["negative"]:
+                        neg_slot.error(f"🔴 负面: {counts['negative']} 条")
+                    else:
+                        neg_slot.success("🔴 负面: 0 条")
+                    if counts["positive"]:
+                        pos_slot.success(f"🟢 正面: {counts['positive']} 条")
+                    else:
+                        pos_slot.info("🟢 正面: 0 条")
+                    neu_slot.info(f"⚪ 中性: {counts['neutral']} 条")
+                    
+                    if len(news_items) <= 15:
+                        icon = _SENTIMENT_ICONS.get(news.sentiment, "📄")
+                        label = _SENTIMENT_LABELS.get(news.sentiment, "")
+                        specific = "📌" if news.is_project_specific else ""
+                        title = news.title if len(news.title) <= 75 else news.title[:75] + "..."
+
+                        with news_area.expander(f"{icon}{specific} {title}", expanded=False):
+                            st.markdown(f"**情感**: {label} | **来源**: {news.source} | **日期**: {news.published}")
+                            st.markdown(f"[🔗 阅读原文]({news.link})")
+                            if news.matched_keywords:
+                                kw_type = "⚠️ 负面关键词" if news.sentiment == "negative" else "✨ 正面关键词" if news.sentiment == "positive" else "🔑 关键词"
+                                st.caption(f"{kw_type}: {', '.join(news.matched_keywords[:5])}")
+                
+                if not news_items:
+                    news_header.subheader("📰 相关新闻 (Recent News) - 0 条")
+                    news_area.success("✅ 未找到相关新闻报道。")
+                elif not has_project_specific:
+                    news_area.info(f"ℹ️ 未找到 {cr_project} 直接相关新闻，以上是加密货币领域的最新动态。")
                 
                 results = analyze_project_compliance(
                     project_name=cr_project,
                     github_owner=cr_github_owner if cr_github_owner else None,
                     github_repo=cr_github_repo if cr_github_repo else None,
-                    github_token=cr_github_token if cr_github_token else None
+                    github_token=cr_github_token if cr_github_token else None,
+                    news_items=news_items
                 )
                 
-                # Display Risk Score
-                risk = results.get("risk_score", {})
-                score = risk.get("score", 50)
-                grade = risk.get("grade", "C")
-                label = risk.get("label", "Unknown")
+                with report_area:
+                    # Display Risk Score
+                    risk = results.get("risk_score", {})
+                    score = risk.get("score", 50)
+                    grade = risk.get("grade", "C")
+                    label = risk.get("label", "Unknown")
                 
-                # Color based on grade
-                grade_colors = {"A": "🟢", "B": "🔵", "C": "🟡", "D": "🟠", "F": "🔴"}
-                grade_icon = grade_colors.get(grade, "⚪")
+                    # Color based on grade
+                    grade_colors = {"A": "🟢", "B": "🔵", "C": "🟡", "D": "🟠", "F": "🔴"}
+                    grade_icon = grade_colors.get(grade, "⚪")
                 
-                st.markdown("---")
-                st.subheader("📊 综合风险评估 (Overall Risk Assessment)")
+                    st.markdown("---")
+                    st.subheader("📊 综合风险评估 (Overall Risk Assessment)")
                 
-                # Show track info
-                track_label = risk.get("track", "未分类")
+                    # Show track info
+                    track_label = risk.get("track", "未分类")
                 
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("项目风险评分", f"{score}/100", help="0=低风险, 100=高风险")
-                with col2:
-                    st.metric("项目风险等级", f"{grade_icon} {grade}")
-                with col3:
-                    st.metric("项目风险描述", label)
-                with col4:
-                    st.metric("项目赛道", track_label)
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric("项目风险评分", f"{score}/100", help="0=低风险, 100=高风险")
+                    with col2:
+                        st.metric("项目风险等级", f"{grade_icon} {grade}")
+                    with col3:
+                        st.metric("项目风险描述", label)
+                    with col4:
+                        st.metric("项目赛道", track_label)
                 
-                # Risk Breakdown with new format
-                breakdown = risk.get("breakdown", {})
-                if breakdown:
-                    st.markdown("##### 📈 风险评分计算")
+                    # Risk Breakdown with new format
+                    breakdown = risk.get("breakdown", {})
+                    if breakdown:
+                        st.markdown("##### 📈 风险评分计算")
                     
-                    # Show calculation
-                    calc = breakdown.get("calculation", {})
-                    if calc:
-                        st.info(f"🧮 **计算公式**: 基准分 ({calc.get('base_score', 0)}) + 风险增项 ({calc.get('total_increase', 0):+d}) + 风险减项 ({calc.get('total_decrease', 0)}) = **{calc.get('final_score', 0)}**")
+                        # Show calculation
+                        calc = breakdown.get("calculation", {})
+                        if calc:
+                            st.info(f"🧮 **计算公式**: 基准分 ({calc.get('base_score', 0)}) + 风险增项 ({calc.get('total_increase', 0):+d}) + 风险减项 ({calc.get('total_decrease', 0)}) = **{calc.get('final_score', 0)}**")
                     
-                    # Track info
-                    track_info = breakdown.get("track", {})
-                    if track_info:
-                        st.caption(f"📌 {track_info.get('description', '')}")
+                        # Track info
+                        track_info = breakdown.get("track", {})
+                        if track_info:
+                            st.caption(f"📌 {track_info.get('description', '')}")
                     
-                    # Risk factors display
-                    col1, col2 = st.columns(2)
+                        # Risk factors display
+                        col1, col2 = st.columns(2)
                     
-                    with col1:
-                        st.markdown("###### 🔴 风险增项")
-                        increases = breakdown.get("risk_increases", [])
-                        if increases:
-                            for item in increases:
-                                st.error(f"**{item['label']}** ({item['impact']}) - {item['category']}")
-                        else:
-                            st.success("✅ 无风险增项")
+                        with col1:
+                            st.markdown("###### 🔴 风险增项")
+                            increases = breakdown.get("risk_increases", [])
+                            if increases:
+                                for item in increases:
+                                    st.error(f"**{item['label']}** ({item['impact']}) - {item['category']}")
+                            else:
+                                st.success("✅ 无风险增项")
                     
-                    with col2:
-                        st.markdown("###### 🟢 风险减项")
-                        decreases = breakdown.get("risk_decreases", [])
-                        if decreases:
-                            for item in decreases:
-                                st.success(f"**{item['label']}** ({item['impact']}) - {item['category']}")
+                        with col2:
+                            st.markdown("###### 🟢 风险减项")
+                            decreases = breakdown.get("risk_decreases", [])
+                            if decreases:
+                                for item in decreases:
+                                    st.success(f"**{item['label']}** ({item['impact']}) - {item['category']}")
                 
-                st.markdown("---")
+                    st.markdown("---")
                 
-                # GitHub Activity Section
-                github_data = results.get("github")
-                if github_data and github_data.success:
-                    st.subheader("📊 GitHub 代码活动 (Code Activity)")
-                    st.markdown(f"**仓库**: [{github_data.owner}/{github_data.repo}](https://github.com/{github_data.owner}/{github_data.repo})")
+                    # GitHub Activity Section
+                    github_data = results.get("github")
+                    if github_data and github_data.success:
+                        st.subheader("📊 GitHub 代码活动 (Code Activity)")
+                        st.markdown(f"**仓库**: [{github_data.owner}/{github_data.repo}](https://github.com/{github_data.owner}/{github_data.repo})")
                     
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        st.metric("Commits (30天)", github_data.commits_30d)
-                    with col2:
-                        st.metric("Commits (90天)", github_data.commits_90d)
-                    with col3:
-                        st.metric("Contributors", github_data.contributors)
-                    with col4:
-                        st.metric("Stars ⭐", f"{github_data.stars:,}")
+                        col1, col2, col3, col4 = st.columns(4)
+                        with col1:
+                            st.metric("Commits (30天)", github_data.commits_30d)
+                        with col2:
+                            st.metric("Commits (90天)", github_data.commits_90d)
+                        with col3:
+                            st.metric("Contributors", github_data.contributors)
+                        with col4:
+                            st.metric("Stars ⭐", f"{github_data.stars:,}")
                     
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Forks", f"{github_data.forks:,}")
-                    with col2:
-                        st.metric("Open Issues", github_data.open_issues)
-                    with col3:
-                        st.metric("Last Commit", github_data.last_commit_date)
-                else:
-                    st.warning("⚠️ GitHub 数据不可用。请手动输入 GitHub Owner 和 Repo。")
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            st.metric("Forks", f"{github_data.forks:,}")
+                        with col2:
+                            st.metric("Open Issues", github_data.open_issues)
+                        with col3:
+                            st.metric("Last Commit", github_data.last_commit_date)
+                    else:
+                        st.warning("⚠️ GitHub 数据不可用。请手动输入 GitHub Owner 和 Repo。")
                 
-                st.markdown("---")
+                    st.markdown("---")
                 
-                # Audit Status Section
-                audit_data = results.get("audit")
-                if audit_data and audit_data.success:
-                    st.subheader("🔐 审计状态 (Audit Status)")
+                    # Audit Status Section
+                    audit_data = results.get("audit")
+                    if audit_data and audit_data.success:
+                        st.subheader("🔐 审计状态 (Audit Status)")
                     
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        audit_badge = "✅ 已审计" if audit_data.audited else "❌ 未审计"
-                        st.metric("审计状态", audit_badge)
-                    with col2:
-                        tvl_formatted = f"${audit_data.tvl:,.0f}" if audit_data.tvl else "N/A"
-                        st.metric("TVL (锁仓量)", tvl_formatted)
-                    with col3:
-                        st.metric("类别", audit_data.category)
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            audit_badge = "✅ 已审计" if audit_data.audited else "❌ 未审计"
+                            st.metric("审计状态", audit_badge)
+                        with col2:
+                            tvl_formatted = f"${audit_data.tvl:,.0f}" if audit_data.tvl else "N/A"
+                            st.metric("TVL (锁仓量)", tvl_formatted)
+                        with col3:
+                            st.metric("类别", audit_data.category)
                     
-                    if audit_data.auditors:
-                        st.markdown(f"**审计机构**: {', '.join(audit_data.auditors[:5])}")
-                else:
-                    st.warning(f"⚠️ 在 DefiLlama 中未找到 '{cr_project}' 的数据。")
-                
-                st.markdown("---")
-                
-                # News Section
-                news_items = results.get("news", [])
-                st.subheader(f"📰 相关新闻 (Recent News) - {len(news_items)} 条")
-                
-                # Check if any news is project-specific
-                project_specific = any(n.is_project_specific for n in news_items)
-                if news_items and not project_specific:
-                    st.info(f"ℹ️ 未找到 {cr_project} 直接相关新闻，以下是加密货币领域的最新动态：")
-                
-                # Count by sentiment
-                negative_news = [n for n in news_items if n.sentiment == "negative"]
-                positive_news = [n for n in news_items if n.sentiment == "positive"]
-                neutral_news = [n for n in news_items if n.sentiment == "neutral"]
-                
-                # Show sentiment summary
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    if negative_news:
-                        st.error(f"🔴 负面: {len(negative_news)} 条")
-                    else:
-                        st.success("🔴 负面: 0 条")
-                with col2:
-                    if positive_news:
-                        st.success(f"🟢 正面: {len(positive_news)} 条")
+                        if audit_data.auditors:
+                            st.markdown(f"**审计机构**: {', '.join(audit_data.auditors[:5])}")
                     else:
-                        st.info("🟢 正面: 0 条")
-                with col3:
-                    st.info(f"⚪ 中性: {len(neutral_news)} 条")
+                        st.warning(f"⚠️ 在 DefiLlama 中未找到 '{cr_project}' 的数据。")
                 
-                if news_items:
-                    # Define sentiment icons
-                    sentiment_icons = {"negative": "🔴", "positive": "🟢", "neutral": "⚪"}
-                    sentiment_labels = {"negative": "负面", "positive": "正面", "neutral": "中性"}
-                    
-                    for news in news_items[:15]:
-                        icon = sentiment_icons.get(news.sentiment, "📄")
-                        label = sentiment_labels.get(news.sentiment, "")
-                        specific = "📌" if news.is_project_specific else ""
-                        
-                        with st.expander(f"{icon}{specific} {news.title[:75]}...", expanded=False):
-                            st.markdown(f"**情感**: {label} | **来源**: {news.source} | **日期**: {news.published}")
-                            st.markdown(f"[🔗 阅读原文]({news.link})")
-                            if news.matched_keywords:
-                                kw_type = "⚠️ 负面关键词" if news.sentiment == "negative" else "✨ 正面关键词" if news.sentiment == "positive" else "🔑 关键词"
-                                st.caption(f"{kw_type}: {', '.join(news.matched_keywords[:5])}")
-                else:
-                    st.success("✅ 未找到相关新闻报道。")
+                    st.markdown("---")
                 
             except Exception as e:
-                st.error(f"❌ 分析失败: {str(e)}")
-                import traceback
-                st.code(traceback.format_exc())
+                st.exception(e)
     
 
 
@@ -2105,17 +2240,18 @@ with tab11:
         train_button = st.button("🤖 Train AI Model", type="primary")
         
     with col_ai_2:
-        if train_button:
+        # Signature of every widget that affects training: retrain only when
+        # it changes, otherwise re-render from the cached results
+        ai_sig = (ai_symbol, ai_timeframe, ai_limit, ai_horizon, ai_model_type,
+                  rf_n_estimators, rf_max_depth, use_walk_forward, n_splits)
+
+        if train_button and st.session_state.get('ai_sig') != ai_sig:
             with st.spinner(f"Training AI Model on {ai_symbol}..."):
                 try:
-                    from backtest_engine import BacktestEngine
-                    from ai_strategy import AIStrategy
-                    import plotly.express as px
-                    import plotly.graph_objects as go
-                    
-                    # 1. Fetch Data
-                    engine = BacktestEngine()
-                    df = engine.fetch_data(ai_symbol, ai_timeframe, limit=ai_limit)
+                    # 1. Fetch Data (engine/model come from st.cache_resource factories,
+                    # so reruns reuse the same objects instead of re-importing sklearn/ccxt)
+                    engine = get_backtest_engine()
+                    df = fetch_ohlcv(ai_symbol, ai_timeframe, ai_limit)
                     
                     if df.empty:
                         st.error("No data fetched.")
@@ -2129,124 +2265,124 @@ with tab11:
                             'LightGBM': 'lightgbm'
                         }
                         model_key = model_key_map.get(ai_model_type, 'random_forest')
-                        ai = AIStrategy(model_type=model_key, n_estimators=rf_n_estimators, max_depth=rf_max_depth)
+                        ai = get_ai_strategy(model_key, rf_n_estimators, rf_max_depth)
                         df = ai.prepare_features(df)
                         df = ai.prepare_labels(df, horizon=ai_horizon)
                         
                         # 3. Train Model (Simple or Walk-Forward)
                         if use_walk_forward:
                             metrics, feature_imp, test_df, y_prob = ai.walk_forward_train(df, n_splits=n_splits)
-                            st.success(f"✅ {ai_model_type} Walk-Forward Trained ({metrics['windows_used']} folds)")
                         else:
                             metrics, feature_imp, test_df, y_prob = ai.train_model(df)
-                            st.success(f"✅ {ai_model_type} Model Trained Successfully!")
-                        
-                        m1, m2, m3 = st.columns(3)
-                        m1.metric("Accuracy", f"{metrics['Accuracy']:.2%}")
-                        m2.metric("Precision", f"{metrics['Precision']:.2%}")
-                        m3.metric("Recall", f"{metrics['Recall']:.2%}")
-                        
-                        # 4.5 Confusion Matrix
-                        st.subheader("🎯 Confusion Matrix")
-                        from sklearn.metrics import confusion_matrix
-                        import plotly.figure_factory as ff
-                        
-                        # Get predictions from probabilities
-                        y_pred = (y_prob >= 0.5).astype(int)
-                        y_actual = test_df['Target'].values
                         
-                        cm = confusion_matrix(y_actual, y_pred)
-                        # Labels: 0 = Price Down, 1 = Price Up
-                        labels = ['Down (0)', 'Up (1)']
-                        
-                        # Create annotated heatmap
-                        fig_cm = ff.create_annotated_heatmap(
-                            z=cm,
-                            x=labels,
-                            y=labels,
-                            colorscale='Blues',
-                            showscale=True
-                        )
-                        fig_cm.update_layout(
-                            title="Predicted vs Actual",
-                            xaxis_title="Predicted",
-                            yaxis_title="Actual"
-                        )
-                        fig_cm['layout']['yaxis']['autorange'] = "reversed"  # Flip y-axis
-                        
-                        col_cm1, col_cm2 = st.columns([2, 1])
-                        with col_cm1:
-                            st.plotly_chart(fig_cm, use_container_width=True)
-                        with col_cm2:
-                            # Explain the confusion matrix
-                            tn, fp, fn, tp = cm.ravel()
-                            st.markdown(f"""
-                            **解读:**
-                            - ✅ True Positive (TP): **{tp}** - 正确预测涨
-                            - ✅ True Negative (TN): **{tn}** - 正确预测跌
-                            - ❌ False Positive (FP): **{fp}** - 误报涨
-                            - ❌ False Negative (FN): **{fn}** - 错过涨
-                            """)
-                        
-                        # 5. Feature Importance
-                        st.subheader("📊 Feature Importance")
-                        fig_imp = px.bar(feature_imp, x='Importance', y='Feature', orientation='h', title="Top Predictors")
-                        st.plotly_chart(fig_imp, use_container_width=True)
-                        
-                        # 6. Backtest Simulation
-                        train_size = int(ai_limit * 0.8)
-                        test_size = ai_limit - train_size
-                        st.subheader(f"💰 AI Strategy Backtest (Test Set: {test_size} candles)")
-                        st.caption(f"📊 Data Split: Training = {train_size} candles | Test = {test_size} candles (80/20 split)")
+                        # 4. Backtest on the held-out window
                         test_df, bt_metrics = ai.run_backtest(test_df, y_prob)
                         
-                        # Display Enhanced Metrics
-                        st.markdown("##### 📈 Performance Metrics")
-                        col_m1, col_m2, col_m3, col_m4 = st.columns(4)
-                        col_m1.metric("Total Return", f"{bt_metrics['total_return']}%", delta_color="normal")
-                        col_m2.metric("Max Drawdown", f"{bt_metrics['max_drawdown']}%", delta_color="inverse")
-                        col_m3.metric("Sharpe Ratio", f"{bt_metrics['sharpe_ratio']}", help="Risk-adjusted return (annualized)")
-                        col_m4.metric("Win Rate", f"{bt_metrics['win_rate']}%")
-                        
-                        # Trade breakdown
-                        st.markdown("##### 📊 Trade Breakdown")
-                        col_t1, col_t2, col_t3 = st.columns(3)
-                        col_t1.metric("Total Trades", bt_metrics['total_trades'])
-                        col_t2.metric(f"Long Trades ({bt_metrics['long_win_rate']}% Win)", bt_metrics['long_trades'])
-                        col_t3.metric(f"Short Trades ({bt_metrics['short_win_rate']}% Win)", bt_metrics['short_trades'])
-                        
-                        # Equity Curve
-                        fig_eq = go.Figure()
-                        fig_eq.add_trace(go.Scatter(x=test_df['timestamp'], y=test_df['Equity'], mode='lines', name='AI Strategy', line=dict(color='cyan')))
-                        # Benchmark (Buy & Hold)
-                        bh_ret = (test_df['close'] / test_df['close'].iloc[0]) * 1000
-                        bh_return = round((bh_ret.iloc[-1] - 1000) / 1000 * 100, 2)
-                        fig_eq.add_trace(go.Scatter(x=test_df['timestamp'], y=bh_ret, mode='lines', name=f'Buy & Hold ({bh_return}%)', line=dict(color='gray', dash='dash')))
-                        
-                        fig_eq.update_layout(title=f"Equity Curve: AI {bt_metrics['total_return']}% vs B&H {bh_return}%", xaxis_title="Time", yaxis_title="Equity ($)")
-                        st.plotly_chart(fig_eq, use_container_width=True)
-                        
-                        # Signals on Chart
-                        st.subheader("🚦 Trade Signals (Long & Short)")
-                        fig_sig = go.Figure()
-                        fig_sig.add_trace(go.Candlestick(x=test_df['timestamp'], open=test_df['open'], high=test_df['high'], low=test_df['low'], close=test_df['close'], name='Price'))
-                        
-                        # Buy Signals (Green Up Triangle)
-                        buy_sigs = test_df[test_df['Signal'] == 1]
-                        fig_sig.add_trace(go.Scatter(x=buy_sigs['timestamp'], y=buy_sigs['low']*0.99, mode='markers', marker=dict(symbol='triangle-up', color='lime', size=12), name='AI Long Signal'))
-                        
-                        # Sell Signals (Red Down Triangle)
-                        sell_sigs = test_df[test_df['Signal'] == -1]
-                        fig_sig.add_trace(go.Scatter(x=sell_sigs['timestamp'], y=sell_sigs['high']*1.01, mode='markers', marker=dict(symbol='triangle-down', color='red', size=12), name='AI Short Signal'))
-                        
-                        fig_sig.update_layout(title="Price & AI Signals (Long/Short)", xaxis_title="Time", yaxis_title="Price")
-                        st.plotly_chart(fig_sig, use_container_width=True)
-                        
-                        # Display signal counts
-                        st.caption(f"📊 Long Signals: {len(buy_sigs)} | Short Signals: {len(sell_sigs)}")
+                        # Persist the trained model and results so unrelated
+                        # reruns (and re-clicks with unchanged widgets) skip the refit
+                        st.session_state['ai_model'] = ai
+                        st.session_state['ai_sig'] = ai_sig
+                        st.session_state['ai_results'] = (metrics, feature_imp, test_df, y_prob, bt_metrics)
                         
                 except Exception as e:
-                    st.error(f"An error occurred: {e}")
                     st.exception(e)
+
+        if st.session_state.get('ai_sig') == ai_sig and 'ai_results' in st.session_state:
+            metrics, feature_imp, test_df, y_prob, bt_metrics = st.session_state['ai_results']
+            
+            if use_walk_forward:
+                st.success(f"✅ {ai_model_type} Walk-Forward Trained ({metrics['windows_used']} folds)")
+            else:
+                st.success(f"✅ {ai_model_type} Model Trained Successfully!")
+            
+            m1, m2, m3 = st.columns(3)
+            m1.metric("Accuracy", f"{metrics['Accuracy']:.2%}")
+            m2.metric("Precision", f"{metrics['Precision']:.2%}")
+            m3.metric("Recall", f"{metrics['Recall']:.2%}")
+            
+            # 4.5 Confusion Matrix
+            st.subheader("🎯 Confusion Matrix")
+
+            # Get predictions from probabilities; for the binary case
+            # the confusion matrix is a single bincount pass (no sklearn)
+            y_pred = (y_prob >= 0.5).astype(np.int8)
+            y_actual = test_df['Target'].values.astype(np.int8)
+
+            # Labels: 0 = Price Down, 1 = Price Up
+            cm = np.bincount(2 * y_actual + y_pred, minlength=4).reshape(2, 2)
+
+            col_cm1, col_cm2 = st.columns([2, 1])
+            with col_cm1:
+                st.markdown(_confusion_matrix_html(cm), unsafe_allow_html=True)
+            with col_cm2:
+                # Explain the confusion matrix
+                tn, fp, fn, tp = cm.ravel()
+                st.markdown(f"""
+                **解读:**
+                - ✅ True Positive (TP): **{tp}** - 正确预测涨
+                - ✅ True Negative (TN): **{tn}** - 正确预测跌
+                - ❌ False Positive (FP): **{fp}** - 误报涨
+                - ❌ False Negative (FN): **{fn}** - 错过涨
+                """)
+            
+            # 5. Feature Importance
+            st.subheader("📊 Feature Importance")
+            fig_imp = px.bar(feature_imp.nlargest(15, 'Importance'), x='Importance', y='Feature', orientation='h', title="Top Predictors")
+            st.plotly_chart(fig_imp, use_container_width=True)
+            
+            # 6. Backtest Simulation
+            train_size = int(ai_limit * 0.8)
+            test_size = ai_limit - train_size
+            st.subheader(f"💰 AI Strategy Backtest (Test Set: {test_size} candles)")
+            st.caption(f"📊 Data Split: Training = {train_size} candles | Test = {test_size} candles (80/20 split)")
+            
+            # Display Enhanced Metrics
+            st.markdown("##### 📈 Performance Metrics")
+            col_m1, col_m2, col_m3, col_m4 = st.columns(4)
+            col_m1.metric("Total Return", f"{bt_metrics['total_return']}%", delta_color="normal")
+            col_m2.metric("Max Drawdown", f"{bt_metrics['max_drawdown']}%", delta_color="inverse")
+            col_m3.metric("Sharpe Ratio", f"{bt_metrics['sharpe_ratio']}", help="Risk-adjusted return (annualized)")
+            col_m4.metric("Win Rate", f"{bt_metrics['win_rate']}%")
+            
+            # Trade breakdown
+            st.markdown("##### 📊 Trade Breakdown")
+            col_t1, col_t2, col_t3 = st.columns(3)
+            col_t1.metric("Total Trades", bt_metrics['total_trades'])
+            col_t2.metric(f"Long Trades ({bt_metrics['long_win_rate']}% Win)", bt_metrics['long_trades'])
+            col_t3.metric(f"Short Trades ({bt_metrics['short_win_rate']}% Win)", bt_metrics['short_trades'])
+            
+            # Equity Curve (static layout template, only the title is dynamic)
+            fig_eq = go.Figure(layout=_EQUITY_LAYOUT)
+            fig_eq.add_trace(go.Scatter(x=test_df['timestamp'], y=test_df['Equity'], mode='lines', name='AI Strategy', line=dict(color='cyan')))
+            # Benchmark (Buy & Hold) - float32 NumPy, no intermediate Series
+            close = test_df['close'].to_numpy(dtype=np.float32)
+            bh_ret = close * np.float32(1000.0 / close[0])
+            bh_return = round((float(bh_ret[-1]) - 1000.0) / 1000.0 * 100, 2)
+            fig_eq.add_trace(go.Scatter(x=test_df['timestamp'], y=bh_ret, mode='lines', name=f'Buy & Hold ({bh_return}%)', line=dict(color='gray', dash='dash')))
+            
+            fig_eq.update_layout(title=f"Equity Curve: AI {bt_metrics['total_return']}% vs B&H {bh_return}%")
+            st.plotly_chart(fig_eq, use_container_width=True)
+            
+            # Signals on Chart
+            st.subheader("🚦 Trade Signals (Long & Short)")
+            fig_sig = go.Figure(layout=_SIGNAL_LAYOUT)
+            fig_sig.add_trace(go.Candlestick(x=test_df['timestamp'], open=test_df['open'], high=test_df['high'], low=test_df['low'], close=test_df['close'], name='Price'))
+            
+            # Signal markers via boolean masks - no DataFrame copies
+            sig = test_df['Signal'].to_numpy()
+            buy_mask = sig == 1
+            sell_mask = sig == -1
+            ts = test_df['timestamp'].to_numpy()
+            
+            # Buy Signals (Green Up Triangle)
+            fig_sig.add_trace(go.Scatter(x=ts[buy_mask], y=test_df['low'].to_numpy()[buy_mask] * 0.99, mode='markers', marker=dict(symbol='triangle-up', color='lime', size=12), name='AI Long Signal'))
+            
+            # Sell Signals (Red Down Triangle)
+            fig_sig.add_trace(go.Scatter(x=ts[sell_mask], y=test_df['high'].to_numpy()[sell_mask] * 1.01, mode='markers', marker=dict(symbol='triangle-down', color='red', size=12), name='AI Short Signal'))
+            
+            st.plotly_chart(fig_sig, use_container_width=True)
+            
+            # Display signal counts
+            st.caption(f"📊 Long Signals: {int(buy_mask.sum())} | Short Signals: {int(sell_mask.sum())}")
         else:
             st.write("👈 Configure and click **Train AI Model** on the left to begin.")
@@ -1,47 +1,431 @@
 import ccxt
+import asyncio
+import os
+import threading
+import time
 import pandas as pd
 import numpy as np
 import talib
 import yfinance as yf
 from typing import Dict, List, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Async ccxt lets multi-page OHLCV requests go out concurrently
+try:
+    import ccxt.async_support as ccxt_async
+    CCXT_ASYNC_AVAILABLE = True
+except Exception:
+    CCXT_ASYNC_AVAILABLE = False
+
+# ccxt.pro (bundled with recent ccxt) adds websocket market-data support
+try:
+    import ccxt.pro as ccxt_pro
+    CCXT_PRO_AVAILABLE = True
+except Exception:
+    CCXT_PRO_AVAILABLE = False
+
+# On-disk OHLCV cache: one parquet file per (symbol, timeframe)
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'crypto-alpha-terminal')
+
+# Numba is optional: with it the PnL kernel below compiles to machine code,
+# without it the same function runs as plain Python over numpy arrays
+# (still far cheaper than the old per-row .iloc loop).
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _simulate_pnl(close, high, low, signal, horizon, stop_loss, take_profit, trailing_stop, fee_rate, initial_capital):
+    """
+    Core SL/TP/TS/Time trade simulation over raw arrays.
+    Returns the equity curve as a float64 ndarray.
+    """
+    n = close.shape[0]
+    equity = np.empty(n, dtype=np.float64)
+    capital = initial_capital
+    position = 0  # 0: None, 1: Long, -1: Short
+    entry_price = 0.0
+    exit_index = -1
+
+    # For Trailing Stop
+    highest_high = 0.0
+    lowest_low = 0.0
+
+    for i in range(n):
+        # Check for exit first (SL/TP/TS or Time-based)
+        if position != 0:
+            current_low = low[i]
+            current_high = high[i]
+            current_close = close[i]
+
+            # Update High/Low for Trailing Stop
+            if position == 1:
+                highest_high = max(highest_high, current_high)
+            elif position == -1:
+                lowest_low = min(lowest_low, current_low)
+
+            exit_price = 0.0
+            exited = False
+
+            # Check SL/TP/TS
+            if position == 1:  # Long
+                sl_price = entry_price * (1 - stop_loss)
+                tp_price = entry_price * (1 + take_profit)
+                ts_price = highest_high * (1 - trailing_stop)
+
+                if stop_loss > 0 and current_low <= sl_price:
+                    exit_price = sl_price
+                    exited = True
+                elif trailing_stop > 0 and current_low <= ts_price:
+                    exit_price = ts_price
+                    exited = True
+                elif take_profit > 0 and current_high >= tp_price:
+                    exit_price = tp_price
+                    exited = True
+                elif i == exit_index:
+                    exit_price = current_close
+                    exited = True
+
+            elif position == -1:  # Short
+                sl_price = entry_price * (1 + stop_loss)
+                tp_price = entry_price * (1 - take_profit)
+                ts_price = lowest_low * (1 + trailing_stop)
+
+                if stop_loss > 0 and current_high >= sl_price:
+                    exit_price = sl_price
+                    exited = True
+                elif trailing_stop > 0 and current_high >= ts_price:
+                    exit_price = ts_price
+                    exited = True
+                elif take_profit > 0 and current_low <= tp_price:
+                    exit_price = tp_price
+                    exited = True
+                elif i == exit_index:
+                    exit_price = current_close
+                    exited = True
+
+            # Execute Exit if triggered
+            if exited:
+                # Calculate Gross PnL
+                if position == 1:
+                    gross_pnl = (exit_price - entry_price) / entry_price
+                else:
+                    gross_pnl = (entry_price - exit_price) / entry_price
+
+                capital *= (1 + gross_pnl) * ((1 - fee_rate) ** 2)
+                position = 0
+
+        # Check for entry (if no position)
+        if position == 0 and i < n - horizon:
+            if signal[i] == 1:  # Buy
+                position = 1
+                entry_price = close[i]
+                highest_high = entry_price  # Init for TS
+                exit_index = i + horizon
+            elif signal[i] == -1:  # Sell
+                position = -1
+                entry_price = close[i]
+                lowest_low = entry_price  # Init for TS
+                exit_index = i + horizon
+
+        equity[i] = capital
+
+    return equity
+
+
+@njit(cache=True, nogil=True)
+def _max_drawdown(equity):
+    """Fused single-pass max drawdown (fraction, <= 0)."""
+    peak = equity[0]
+    mdd = 0.0
+    for v in equity:
+        if v > peak:
+            peak = v
+        dd = (v - peak) / peak
+        if dd < mdd:
+            mdd = dd
+    return mdd
+
+
+@njit(cache=True, nogil=True)
+def _ema_recurrence(values, period, seed):
+    """ema_t = alpha*x_t + (1-alpha)*ema_{t-1}, continued from a prior seed."""
+    alpha = 2.0 / (period + 1.0)
+    out = np.empty(values.shape[0], dtype=np.float64)
+    ema = seed
+    for i in range(values.shape[0]):
+        ema = alpha * values[i] + (1.0 - alpha) * ema
+        out[i] = ema
+    return out
+
+
+def _warm_kernels():
+    """
+    Pre-trigger JIT compilation of the numba kernels on tiny inputs so the
+    first real backtest doesn't pay the compile latency. With cache=True the
+    compiled machine code also persists on disk across processes.
+    """
+    dummy = np.zeros(4, dtype=np.float64)
+    _simulate_pnl(dummy, dummy, dummy, dummy, 1, 0.02, 0.04, 0.0, 0.001, 1000.0)
+    _max_drawdown(np.ones(4, dtype=np.float64))
+
+
+def _crossover_int8(diff):
+    """
+    Encode crossovers of a difference series via sign transitions: +1 where
+    the sign flips up to positive, -1 where it flips down to negative.
+    One fused pass instead of two mask+shift comparisons per crossover.
+    """
+    state = np.sign(diff)
+    state[np.isnan(diff)] = 0
+    state = state.astype(np.int8)
+    trans = np.zeros_like(state)
+    if len(state) > 1:
+        trans[1:] = state[1:] - state[:-1]
+    out = np.zeros_like(state)
+    out[(state == 1) & (trans > 0)] = 1
+    out[(state == -1) & (trans < 0)] = -1
+    return out
+
+
+class StreamingIndicators:
+    """
+    O(1)-per-bar indicator updates for live monitoring. Keeps a bounded
+    window of recent bars and uses talib.stream to compute only the latest
+    RSI/MACD/Stoch values; the previous MACD/Stoch relation is carried over
+    so crossovers are emitted without recomputing history.
+    """
+
+    def __init__(self, max_period: int = 250):
+        self.highs = deque(maxlen=max_period)
+        self.lows = deque(maxlen=max_period)
+        self.closes = deque(maxlen=max_period)
+        self._prev_macd_state = 0
+        self._prev_stoch_state = 0
+
+    @staticmethod
+    def _sign_state(a, b):
+        if np.isnan(a) or np.isnan(b):
+            return 0
+        return int(np.sign(a - b))
+
+    def update(self, high: float, low: float, close: float) -> Dict:
+        """Ingest one bar; returns the latest indicator values and crossovers."""
+        from talib import stream
+
+        self.highs.append(high)
+        self.lows.append(low)
+        self.closes.append(close)
+
+        n = len(self.closes)
+        closes = np.fromiter(self.closes, dtype=np.float64, count=n)
+        highs = np.fromiter(self.highs, dtype=np.float64, count=n)
+        lows = np.fromiter(self.lows, dtype=np.float64, count=n)
+
+        rsi = stream.RSI(closes, timeperiod=14)
+        macd, macd_signal, macd_hist = stream.MACD(closes, fastperiod=12, slowperiod=26, signalperiod=9)
+        slowk, slowd = stream.STOCH(highs, lows, closes, fastk_period=14, slowk_period=3, slowd_period=3)
+
+        # Crossovers from sign-state transitions (same rules as generate_signals)
+        macd_state = self._sign_state(macd, macd_signal)
+        macd_cross = 0
+        if macd_state == 1 and self._prev_macd_state <= 0:
+            macd_cross = 1
+        elif macd_state == -1 and self._prev_macd_state >= 0:
+            macd_cross = -1
+        self._prev_macd_state = macd_state
+
+        stoch_state = self._sign_state(slowk, slowd)
+        stoch_cross = 0
+        if stoch_state == 1 and self._prev_stoch_state <= 0 and slowk < 20:
+            stoch_cross = 1
+        elif stoch_state == -1 and self._prev_stoch_state >= 0 and slowk > 80:
+            stoch_cross = -1
+        self._prev_stoch_state = stoch_state
+
+        return {
+            'RSI': rsi,
+            'MACD': macd,
+            'MACD_Signal_Line': macd_signal,
+            'MACD_Hist': macd_hist,
+            'Stoch_K': slowk,
+            'Stoch_D': slowd,
+            'MACD_Cross': macd_cross,
+            'Stoch_Cross': stoch_cross,
+        }
+
 
 class BacktestEngine:
+    # Columns produced by calculate_indicators (used by the indicator memo)
+    INDICATOR_COLS = ['RSI', 'MACD', 'MACD_Signal_Line', 'MACD_Hist', 'ROC',
+                      'Stoch_K', 'Stoch_D', 'WillR', 'WillR_EMA', 'EMA_200', 'ADX']
+
     def __init__(self):
         self.exchange = ccxt.binance({'enableRateLimit': True})
-
-    def fetch_data(self, symbol: str = 'BTC/USDT', timeframe: str = '1h', limit: int = 1000) -> pd.DataFrame:
-        """Fetch historical OHLCV data from Binance (supports >1000 candles via pagination)"""
+        # Memo of indicator arrays keyed by (symbol, timeframe, last_ts, len):
+        # parameter sweeps over horizon/SL/TP reuse identical indicator output
+        self._indicator_cache = {}
+        # Previous frame's (timestamps, EMA_200) per (symbol, timeframe):
+        # lets the EMA recurrence re-seed at the next window's start instead
+        # of re-warming 200 bars
+        self._ema_state = {}
+        if NUMBA_AVAILABLE:
+            # Warm the JIT in the background while the user is still setting
+            # parameters; harmless if the compile finishes after first use
+            threading.Thread(target=_warm_kernels, daemon=True).start()
+
+    def _cache_path(self, symbol: str, timeframe: str) -> str:
+        return os.path.join(CACHE_DIR, f"{symbol.replace('/', '-')}_{timeframe}.parquet")
+
+    async def _fetch_ohlcv_async(self, symbol: str, timeframe: str, limit: int, end_time: int = None) -> list:
+        """
+        Fetch all pages concurrently. Binance accepts an explicit endTime, so
+        the page boundaries can be computed up front and the requests raced
+        with asyncio.gather instead of paying one round trip per page.
+        """
+        exchange = ccxt_async.binance({'enableRateLimit': True})
         try:
-            all_ohlcv = []
+            timeframe_ms = exchange.parse_timeframe(timeframe) * 1000
+            if end_time is None:
+                # End of the current (still-forming) candle
+                end_time = int(time.time() * 1000) // timeframe_ms * timeframe_ms + timeframe_ms - 1
+
+            pages = []
+            et = end_time
             remaining = limit
-            since = None
-            
-            # Fetch most recent data first
             while remaining > 0:
-                fetch_limit = min(remaining, 1000)
-                
-                # If we have data, we need to fetch data BEFORE the oldest timestamp we have
-                params = {}
-                if all_ohlcv:
-                    # all_ohlcv[0] is the oldest candle, index 0 is timestamp
-                    # We want data ending before this timestamp
-                    params['endTime'] = all_ohlcv[0][0] - 1
-                
-                ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=fetch_limit, params=params)
-                
-                if not ohlcv:
-                    break
-                
-                # Prepend new data (since we are fetching backwards)
-                all_ohlcv = ohlcv + all_ohlcv
-                remaining -= len(ohlcv)
-                
-                # Safety break if we got fewer than requested (reached beginning of history)
-                if len(ohlcv) < fetch_limit:
-                    break
-                    
-            df = pd.DataFrame(all_ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+                page_size = min(remaining, 1000)
+                pages.append((et, page_size))
+                et -= page_size * timeframe_ms
+                remaining -= page_size
+
+            responses = await asyncio.gather(*[
+                exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=page_size, params={'endTime': page_et})
+                for page_et, page_size in pages
+            ])
+        finally:
+            await exchange.close()
+
+        # Merge, dedupe on timestamp, sort ascending
+        seen = set()
+        merged = []
+        for page in responses:
+            for row in page:
+                if row[0] not in seen:
+                    seen.add(row[0])
+                    merged.append(row)
+        merged.sort(key=lambda r: r[0])
+        return merged[-limit:]
+
+    def _fetch_ohlcv_paginated(self, symbol: str, timeframe: str, limit: int, end_time: int = None) -> list:
+        """Collect 'limit' candles ending at end_time (or now)."""
+        # Multi-page requests go through the concurrent async path when available
+        if limit > 1000 and CCXT_ASYNC_AVAILABLE:
+            try:
+                return asyncio.run(self._fetch_ohlcv_async(symbol, timeframe, limit, end_time))
+            except Exception as e:
+                print(f"Async OHLCV fetch failed: {e}. Falling back to sequential pagination...")
+
+        # Sequential fallback: paginate backwards from the newest candle
+        all_ohlcv = []
+        remaining = limit
+
+        # Fetch most recent data first
+        while remaining > 0:
+            fetch_limit = min(remaining, 1000)
+
+            # If we have data, we need to fetch data BEFORE the oldest timestamp we have
+            params = {}
+            if all_ohlcv:
+                # all_ohlcv[0] is the oldest candle, index 0 is timestamp
+                # We want data ending before this timestamp
+                params['endTime'] = all_ohlcv[0][0] - 1
+            elif end_time is not None:
+                params['endTime'] = end_time
+
+            ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=fetch_limit, params=params)
+
+            if not ohlcv:
+                break
+
+            # Prepend new data (since we are fetching backwards)
+            all_ohlcv = ohlcv + all_ohlcv
+            remaining -= len(ohlcv)
+
+            # Safety break if we got fewer than requested (reached beginning of history)
+            if len(ohlcv) < fetch_limit:
+                break
+
+        return all_ohlcv
+
+    def fetch_data(self, symbol: str = 'BTC/USDT', timeframe: str = '1h', limit: int = 1000) -> pd.DataFrame:
+        """
+        Fetch historical OHLCV data from Binance (supports >1000 candles via pagination).
+        Candles are cached on disk per (symbol, timeframe); repeat calls only
+        fetch the candles newer than the cached tail instead of re-paginating.
+        """
+        try:
+            cache_path = self._cache_path(symbol, timeframe)
+            cached = None
+            try:
+                if os.path.exists(cache_path):
+                    cached = pd.read_parquet(cache_path)
+            except Exception:
+                cached = None  # unreadable cache -> refetch from scratch
+
+            timeframe_ms = self.exchange.parse_timeframe(timeframe) * 1000
+            # Snap "now" to the candle boundary so the cache key is stable
+            # within a candle and the still-forming candle is always refetched
+            current_open = int(time.time() * 1000) // timeframe_ms * timeframe_ms
+
+            if cached is not None and len(cached) >= limit:
+                last_ms = int(cached['timestamp'].iloc[-1].value // 1_000_000)
+                if last_ms >= current_open:
+                    # Cache already covers the current candle
+                    return cached.iloc[-limit:].reset_index(drop=True)
+                # Fetch only the delta (re-including the cached tail candle,
+                # which may still have been forming when it was stored)
+                missing = int((current_open - last_ms) // timeframe_ms) + 1
+                all_ohlcv = self._fetch_ohlcv_paginated(symbol, timeframe, min(missing, limit))
+            else:
+                all_ohlcv = self._fetch_ohlcv_paginated(symbol, timeframe, limit)
+
+            # Build columns straight from a numeric buffer instead of a
+            # list-of-lists (which goes through object dtype first); float32
+            # halves the bytes every indicator/signal pass has to move
+            arr = np.asarray(all_ohlcv, dtype=np.float64).reshape(-1, 6)
+            df = pd.DataFrame({
+                'timestamp': pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms'),
+                'open': arr[:, 1].astype(np.float32),
+                'high': arr[:, 2].astype(np.float32),
+                'low': arr[:, 3].astype(np.float32),
+                'close': arr[:, 4].astype(np.float32),
+                'volume': arr[:, 5].astype(np.float32),
+            })
+
+            if cached is not None:
+                df = pd.concat([cached, df], ignore_index=True)
+                df = df.drop_duplicates(subset='timestamp', keep='last').sort_values('timestamp').reset_index(drop=True)
+
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                df.to_parquet(cache_path, compression='zstd')
+            except Exception:
+                pass  # cache is best-effort; never fail the fetch over it
+
+            if len(df) > limit:
+                df = df.iloc[-limit:].reset_index(drop=True)
             return df
         except Exception as e:
             print(f"Error fetching data from Binance: {e}. Trying Yahoo Finance fallback...")
@@ -52,6 +436,17 @@ class BacktestEngine:
         try:
             # 1. Map Symbol (BTC/USDT -> BTC-USD)
             yf_symbol = symbol.replace('/', '-').replace('USDT', 'USD')
+
+            # A 2y hourly download is slow; memoize it on disk for an hour
+            cache_path = os.path.join(CACHE_DIR, f"yf_{yf_symbol}_{timeframe}.parquet")
+            try:
+                if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < 3600:
+                    df = pd.read_parquet(cache_path)
+                    if len(df) > limit:
+                        df = df.iloc[-limit:]
+                    return df.reset_index(drop=True)
+            except Exception:
+                pass  # unreadable cache -> re-download
             
             # 2. Map Timeframe
             # ccxt: 1h, 4h, 1d
@@ -67,7 +462,7 @@ class BacktestEngine:
                 pass
             
             print(f"Fetching {yf_symbol} from Yahoo Finance...")
-            df = yf.download(yf_symbol, period=period, interval=timeframe, progress=False)
+            df = yf.download(yf_symbol, period=period, interval=timeframe, progress=False, threads=True)
             
             if df.empty:
                 return pd.DataFrame()
@@ -99,8 +494,13 @@ class BacktestEngine:
             req_cols = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
             df = df[[c for c in req_cols if c in df.columns]]
             
-            # Sort and Slice
+            # Sort, cache the full standardized frame, then Slice
             df = df.sort_values('timestamp')
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                df.to_parquet(cache_path, compression='zstd')
+            except Exception:
+                pass
             if len(df) > limit:
                 df = df.iloc[-limit:]
                 
@@ -116,9 +516,11 @@ class BacktestEngine:
         if len(df) < 50:
             return df
 
-        close = df['close'].values
-        high = df['high'].values
-        low = df['low'].values
+        # TA-Lib only accepts double input; up-cast once here while the
+        # rest of the pipeline stays float32
+        close = df['close'].to_numpy(dtype=np.float64)
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
 
         # 1. RSI (14)
         df['RSI'] = talib.RSI(close, timeperiod=14)
@@ -150,68 +552,167 @@ class BacktestEngine:
 
         return df
 
+    async def watch_ohlcv(self, symbol: str = 'BTC/USDT', timeframe: str = '1h'):
+        """
+        Live mode: subscribe to pushed OHLCV over websocket and yield each
+        closed candle together with its streaming indicator values. The REST
+        fetch_data path remains the backfill mechanism; this replaces
+        per-interval polling (and its rate-limit cost) entirely.
+        """
+        if not CCXT_PRO_AVAILABLE:
+            raise RuntimeError("ccxt.pro is not available; upgrade ccxt for websocket support")
+
+        exchange = ccxt_pro.binance({'enableRateLimit': True})
+        indicators = StreamingIndicators()
+        prev_candle = None
+        try:
+            while True:
+                candles = await exchange.watch_ohlcv(symbol, timeframe)
+                for candle in candles:
+                    if prev_candle is not None and candle[0] > prev_candle[0]:
+                        # A new open timestamp means the previous candle
+                        # closed: fold it into the streaming pipeline
+                        values = indicators.update(prev_candle[2], prev_candle[3], prev_candle[4])
+                        yield prev_candle, values
+                    prev_candle = candle
+        finally:
+            await exchange.close()
+
+    def _apply_incremental_ema(self, symbol: str, timeframe: str, df: pd.DataFrame) -> bool:
+        """
+        Re-seed EMA_200 at the frame's first bar from the previous run's
+        cached column and run the exponential recurrence across the whole
+        frame, so the reduced warmup never leaves leading rows NaN. Returns
+        True when the frame was fully covered this way; the caller falls
+        back to a full-warmup fetch otherwise.
+        """
+        if df.empty:
+            return False
+        key = (symbol, timeframe)
+        ts = df['timestamp'].to_numpy()
+
+        covered = False
+        state = self._ema_state.get(key)
+        if state is not None and 'EMA_200' in df.columns:
+            prev_ts, prev_ema = state
+            idx = int(np.searchsorted(prev_ts, ts[0]))
+            if idx < len(prev_ts) and prev_ts[idx] == ts[0] and np.isfinite(prev_ema[idx]):
+                close = df['close'].to_numpy(dtype=np.float64)
+                ema = np.empty(len(ts), dtype=np.float64)
+                ema[0] = prev_ema[idx]
+                if len(ts) > 1:
+                    ema[1:] = _ema_recurrence(close[1:], 200, prev_ema[idx])
+                df['EMA_200'] = ema
+                covered = True
+
+        if 'EMA_200' in df.columns and np.isfinite(df['EMA_200'].iloc[-1]):
+            self._ema_state[key] = (
+                ts.copy(), df['EMA_200'].to_numpy(dtype=np.float64).copy())
+        return covered
+
+    def stream_update(self, df: pd.DataFrame, new_candle: dict) -> pd.DataFrame:
+        """
+        Append one live candle and fill only its indicator values using
+        talib.stream, instead of recomputing every full indicator array.
+        """
+        df = pd.concat([df, pd.DataFrame([new_candle])], ignore_index=True)
+
+        from talib import stream
+
+        close = df['close'].to_numpy(dtype=np.float64)
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        i = len(df) - 1
+
+        df.loc[i, 'RSI'] = stream.RSI(close, timeperiod=14)
+        macd, macd_signal, macd_hist = stream.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
+        df.loc[i, 'MACD'] = macd
+        df.loc[i, 'MACD_Signal_Line'] = macd_signal
+        df.loc[i, 'MACD_Hist'] = macd_hist
+        df.loc[i, 'ROC'] = stream.ROC(close, timeperiod=10)
+        slowk, slowd = stream.STOCH(high, low, close, fastk_period=14, slowk_period=3, slowd_period=3)
+        df.loc[i, 'Stoch_K'] = slowk
+        df.loc[i, 'Stoch_D'] = slowd
+        df.loc[i, 'WillR'] = stream.WILLR(high, low, close, timeperiod=14)
+        df.loc[i, 'WillR_EMA'] = stream.EMA(df['WillR'].to_numpy(dtype=np.float64), timeperiod=6)
+        df.loc[i, 'EMA_200'] = stream.EMA(close, timeperiod=200)
+        df.loc[i, 'ADX'] = stream.ADX(high, low, close, timeperiod=14)
+
+        return df
+
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
         """Generate -1 (Sell), 0 (Neutral), 1 (Buy) signals"""
-        
-        # Initialize signal columns
-        for ind in ['RSI', 'MACD', 'ROC', 'Stoch', 'WillR']:
-            df[f'{ind}_Signal'] = 0
+        # One fused numpy pass per indicator writing into a preallocated
+        # int8 array: the previous df.loc[mask] assignments each allocated
+        # boolean masks plus .shift(1) copies of the full column.
+        n = len(df)
 
         # 1. RSI Logic
         # Buy < 30, Sell > 70
-        df.loc[df['RSI'] < 30, 'RSI_Signal'] = 1
-        df.loc[df['RSI'] > 70, 'RSI_Signal'] = -1
+        rsi = df['RSI'].to_numpy()
+        rsi_sig = np.zeros(n, dtype=np.int8)
+        rsi_sig[rsi < 30] = 1
+        rsi_sig[rsi > 70] = -1
 
         # 2. MACD Logic
-        # Buy: MACD > Signal (Crossover) - Simplified to just being above
-        # Better logic: Crossover. But for vectorization, let's use:
-        # Buy if MACD > Signal AND MACD.shift(1) < Signal.shift(1) (Golden Cross)
-        # Sell if MACD < Signal AND MACD.shift(1) > Signal.shift(1) (Death Cross)
-        # For simplicity in this "state" check, let's use the user's likely interpretation or standard trend following
-        # Let's use the standard crossover logic for signals
-        
-        # Golden Cross
-        df.loc[(df['MACD'] > df['MACD_Signal_Line']) & (df['MACD'].shift(1) <= df['MACD_Signal_Line'].shift(1)), 'MACD_Signal'] = 1
-        # Death Cross
-        df.loc[(df['MACD'] < df['MACD_Signal_Line']) & (df['MACD'].shift(1) >= df['MACD_Signal_Line'].shift(1)), 'MACD_Signal'] = -1
+        # Buy: Golden Cross (MACD crosses above Signal Line)
+        # Sell: Death Cross (MACD crosses below Signal Line)
+        macd = df['MACD'].to_numpy()
+        macd_line = df['MACD_Signal_Line'].to_numpy()
+        macd_sig = _crossover_int8(macd - macd_line)
 
         # 3. ROC Logic
-        # Buy > 0, Sell < 0 (Simple Momentum)
-        # Or crossing 0
-        df.loc[(df['ROC'] > 0) & (df['ROC'].shift(1) <= 0), 'ROC_Signal'] = 1
-        df.loc[(df['ROC'] < 0) & (df['ROC'].shift(1) >= 0), 'ROC_Signal'] = -1
+        # Buy/Sell on zero-line crossings
+        roc_sig = _crossover_int8(df['ROC'].to_numpy())
 
         # 4. Stochastic Logic
         # Buy: %K crosses above %D (Golden Cross) AND %K < 20 (Oversold)
         # Sell: %K crosses below %D (Death Cross) AND %K > 80 (Overbought)
-        
-        # Golden Cross in Oversold Zone
-        df.loc[(df['Stoch_K'] > df['Stoch_D']) & 
-               (df['Stoch_K'].shift(1) <= df['Stoch_D'].shift(1)) & 
-               (df['Stoch_K'] < 20), 'Stoch_Signal'] = 1
-               
-        # Death Cross in Overbought Zone
-        df.loc[(df['Stoch_K'] < df['Stoch_D']) & 
-               (df['Stoch_K'].shift(1) >= df['Stoch_D'].shift(1)) & 
-               (df['Stoch_K'] > 80), 'Stoch_Signal'] = -1
+        k = df['Stoch_K'].to_numpy()
+        d = df['Stoch_D'].to_numpy()
+        stoch_sig = _crossover_int8(k - d)
+        stoch_sig[(stoch_sig == 1) & (k >= 20)] = 0
+        stoch_sig[(stoch_sig == -1) & (k <= 80)] = 0
 
         # 5. Williams %R Logic (Smoothed)
         # Buy: Smoothed WillR crosses above -80 (Exit Oversold)
         # Sell: Smoothed WillR crosses below -20 (Exit Overbought)
-        
-        # Cross above -80
-        df.loc[(df['WillR_EMA'] > -80) & (df['WillR_EMA'].shift(1) <= -80), 'WillR_Signal'] = 1
-        
-        # Cross below -20
-        df.loc[(df['WillR_EMA'] < -20) & (df['WillR_EMA'].shift(1) >= -20), 'WillR_Signal'] = -1
+        wr = df['WillR_EMA'].to_numpy()
+        willr_sig = np.zeros(n, dtype=np.int8)
+        willr_sig[1:][(wr[1:] > -80) & (wr[:-1] <= -80)] = 1
+        willr_sig[1:][(wr[1:] < -20) & (wr[:-1] >= -20)] = -1
 
         # ADX is a filter, usually doesn't generate directional signals alone.
-        # We can use it to filter other signals (e.g., only trade if ADX > 25)
-        # For this backtest, we'll treat it as a filter strength metric, or maybe skip it for direct signal generation
-        # The user asked to backtest "these 6 indicators". Let's treat ADX as a trend strength confirmation?
-        # Or maybe just skip ADX for "Win Rate" calculation as it's non-directional.
-        # I will calculate it but not generate a directional signal for it in this basic version.
+        # It is applied as a trade filter in run_backtest instead.
+
+        # Assign all five signal columns back in one pass
+        df['RSI_Signal'] = rsi_sig
+        df['MACD_Signal'] = macd_sig
+        df['ROC_Signal'] = roc_sig
+        df['Stoch_Signal'] = stoch_sig
+        df['WillR_Signal'] = willr_sig
+
+        return df
 
+    def _fetch_with_indicators(self, symbol: str, timeframe: str, n: int) -> pd.DataFrame:
+        """Fetch n candles with indicator columns attached, reusing the memo
+        when the data window is unchanged (skips the talib recompute)."""
+        df = self.fetch_data(symbol, timeframe, limit=n)
+        if df.empty:
+            return df
+        cache_key = (symbol, timeframe, int(df['timestamp'].iloc[-1].value), len(df))
+        cached_ind = self._indicator_cache.get(cache_key)
+        if cached_ind is not None:
+            for col, arr in cached_ind.items():
+                df[col] = arr
+        else:
+            df = self.calculate_indicators(df)
+            if len(self._indicator_cache) >= 8:
+                # Evict oldest entry (dicts preserve insertion order)
+                self._indicator_cache.pop(next(iter(self._indicator_cache)))
+            self._indicator_cache[cache_key] = {
+                col: df[col].to_numpy() for col in self.INDICATOR_COLS if col in df.columns
+            }
         return df
 
     def run_backtest(self, symbol: str = 'BTC/USDT', timeframe: str = '1h', horizon: int = 3, stop_loss: float = 0.02, take_profit: float = 0.04, limit: int = 1000, use_trend_filter: bool = False, trailing_stop: float = 0.0, adx_threshold: int = 0) -> Dict:
@@ -223,92 +724,83 @@ class BacktestEngine:
         Trailing Stop: If > 0, activates trailing stop logic.
         ADX Filter: If > 0, only trade when ADX > Threshold.
         """
-        # Fetch extra data for indicator warmup (e.g. EMA 200 needs 200 candles)
-        warmup = 200
-        df = self.fetch_data(symbol, timeframe, limit=limit + warmup)
-        
+        # Fetch extra data for indicator warmup. EMA 200 is what forces the
+        # 200-candle over-fetch; with the previous run's EMA column cached
+        # the recurrence re-seeds at this window's start and only the short-
+        # window indicators (RSI/MACD/Stoch/ADX) still need warmup.
+        warmup = 50 if (symbol, timeframe) in self._ema_state else 200
+        df = self._fetch_with_indicators(symbol, timeframe, limit + warmup)
+
         if df.empty:
             return {"error": "No data fetched"}
 
-        df = self.calculate_indicators(df)
-        
+        if not self._apply_incremental_ema(symbol, timeframe, df) and warmup < 200:
+            # Cached seed predates this window (too many candles since the
+            # last run, or a larger limit): redo with the full cold-run
+            # warmup so the trend filter never sees NaN EMA rows
+            df = self._fetch_with_indicators(symbol, timeframe, limit + 200)
+            if df.empty:
+                return {"error": "No data fetched"}
+            self._apply_incremental_ema(symbol, timeframe, df)
+
         # Slice back to the requested limit
         if len(df) > limit:
             df = df.iloc[-limit:].reset_index(drop=True)
 
         df = self.generate_signals(df)
 
-        # Calculate Future Returns
-        # (Close[T+H] - Close[T]) / Close[T]
-        df['Future_Ret'] = df['close'].shift(-horizon) - df['close']
-        
-        results = {}
+        # Calculate Future Returns (Close[T+H] - Close[T]) once as a raw
+        # array; .shift(-horizon) would copy the column on every run
+        close_arr = df['close'].to_numpy(dtype=np.float64)
+        future_ret = np.full(len(close_arr), np.nan)
+        if horizon < len(close_arr):
+            future_ret[:-horizon] = close_arr[horizon:] - close_arr[:-horizon]
+        df['Future_Ret'] = future_ret
         
         indicators = ['RSI', 'MACD', 'ROC', 'Stoch', 'WillR']
-        
-        for ind in indicators:
-            sig_col = f'{ind}_Signal'
-            
-            # Initialize counters
-            buy_wins = 0
-            sell_wins = 0
-            
-            # Apply Trend Filter if enabled
+
+        # Apply filters in the main thread first (they rewrite the signal
+        # columns that the chart also displays); np.where over raw arrays
+        # replaces the old df.loc chained-mask assignments
+        if use_trend_filter or adx_threshold > 0:
+            # The blocking masks are identical for all 5 indicators, so
+            # compute each comparison once instead of per iteration
+            buy_block = sell_block = adx_block = None
             if use_trend_filter:
-                # Filter Buy Signals: Must be above EMA 200
-                df.loc[(df['close'] < df['EMA_200']) & (df[sig_col] == 1), sig_col] = 0
-                
-                # Filter Sell Signals: Must be below EMA 200
-                df.loc[(df['close'] > df['EMA_200']) & (df[sig_col] == -1), sig_col] = 0
-            
-            # Apply ADX Filter if enabled
+                close = df['close'].to_numpy()
+                ema = df['EMA_200'].to_numpy()
+                buy_block = close < ema    # Buy only above EMA 200
+                sell_block = close > ema   # Sell only below EMA 200
             if adx_threshold > 0:
-                df.loc[(df['ADX'] < adx_threshold) & (df[sig_col] != 0), sig_col] = 0
-            
-            # Buy Signals
-            buy_signals = df[df[sig_col] == 1]
-            if len(buy_signals) > 0:
-                # Win if Future_Ret > 0
-                buy_wins = len(buy_signals[buy_signals['Future_Ret'] > 0])
-                buy_win_rate = buy_wins / len(buy_signals)
-            else:
-                buy_win_rate = 0.0
-
-            # Sell Signals
-            sell_signals = df[df[sig_col] == -1]
-            if len(sell_signals) > 0:
-                # Win if Future_Ret < 0
-                sell_wins = len(sell_signals[sell_signals['Future_Ret'] < 0])
-                sell_win_rate = sell_wins / len(sell_signals)
-            else:
-                sell_win_rate = 0.0
-
-            # Combined Win Rate (Weighted by number of trades)
-            total_trades = len(buy_signals) + len(sell_signals)
-            if total_trades > 0:
-                total_win_rate = (buy_wins + sell_wins) / total_trades
-            else:
-                total_win_rate = 0.0
-
-            # Calculate PnL (Total Return & Max Drawdown)
-            df_pnl = self.calculate_pnl_curve(df, ind, horizon=horizon, stop_loss=stop_loss, take_profit=take_profit, trailing_stop=trailing_stop)
-            final_equity = df_pnl['Equity'].iloc[-1]
-            total_return = (final_equity - 1000) / 1000 * 100
-            
-            peak = df_pnl['Equity'].cummax()
-            drawdown = (df_pnl['Equity'] - peak) / peak
-            max_dd = drawdown.min() * 100
-
-            results[ind] = {
-                "Win Rate": round(total_win_rate * 100, 2),
-                "Buy Signals": len(buy_signals),
-                "Sell Signals": len(sell_signals),
-                "Buy Win Rate": round(buy_win_rate * 100, 2),
-                "Sell Win Rate": round(sell_win_rate * 100, 2),
-                "Total Return": round(total_return, 2),
-                "Max Drawdown": round(max_dd, 2),
-                "Total Signals": len(buy_signals) + len(sell_signals)
+                adx_block = df['ADX'].to_numpy() < adx_threshold
+
+            for ind in indicators:
+                sig_col = f'{ind}_Signal'
+                sig = df[sig_col].to_numpy()
+
+                if buy_block is not None:
+                    sig = np.where(buy_block & (sig == 1), 0, sig)
+                    sig = np.where(sell_block & (sig == -1), 0, sig)
+
+                # ADX Filter: only trade when ADX clears the threshold
+                if adx_block is not None:
+                    sig = np.where(adx_block, 0, sig)
+
+                df[sig_col] = sig
+
+        # The 5 evaluations are independent (read-only on df), so run them
+        # in parallel; the numba PnL kernel is compiled with nogil=True so
+        # threads actually overlap on the hot loop
+        with ThreadPoolExecutor(max_workers=len(indicators)) as pool:
+            futures = {
+                ind: pool.submit(
+                    self._eval_indicator, df, ind, future_ret,
+                    horizon=horizon, stop_loss=stop_loss,
+                    take_profit=take_profit, trailing_stop=trailing_stop
+                )
+                for ind in indicators
             }
+            results = {ind: fut.result() for ind, fut in futures.items()}
 
         return {
             "symbol": symbol,
@@ -325,108 +817,69 @@ class BacktestEngine:
             "df": df  # Return the dataframe for visualization
         }
 
+    def _eval_indicator(self, df: pd.DataFrame, ind: str, fret: np.ndarray, horizon: int, stop_loss: float, take_profit: float, trailing_stop: float) -> Dict:
+        """Win-rate counts + PnL simulation for a single indicator."""
+        sig_col = f'{ind}_Signal'
+
+        # Pure numpy reductions over the shared Future_Ret array:
+        # boolean-indexing the DataFrame here would materialize a filtered
+        # copy per expression
+        sig = df[sig_col].to_numpy()
+
+        buy = sig == 1
+        sell = sig == -1
+        n_buy = int(buy.sum())
+        n_sell = int(sell.sum())
+
+        # Buy wins if Future_Ret > 0, Sell wins if Future_Ret < 0
+        buy_wins = int((buy & (fret > 0)).sum())
+        sell_wins = int((sell & (fret < 0)).sum())
+
+        buy_win_rate = buy_wins / n_buy if n_buy > 0 else 0.0
+        sell_win_rate = sell_wins / n_sell if n_sell > 0 else 0.0
+
+        # Combined Win Rate (Weighted by number of trades)
+        total_trades = n_buy + n_sell
+        total_win_rate = (buy_wins + sell_wins) / total_trades if total_trades > 0 else 0.0
+
+        # Calculate PnL (Total Return & Max Drawdown) on the raw equity
+        # array - no frame copy, no Equity column assignment
+        equity = self._equity_curve(df, ind, horizon=horizon, stop_loss=stop_loss, take_profit=take_profit, trailing_stop=trailing_stop)
+        total_return = (equity[-1] - 1000) / 1000 * 100
+
+        max_dd = _max_drawdown(equity) * 100
+
+        return {
+            "Win Rate": round(total_win_rate * 100, 2),
+            "Buy Signals": n_buy,
+            "Sell Signals": n_sell,
+            "Buy Win Rate": round(buy_win_rate * 100, 2),
+            "Sell Win Rate": round(sell_win_rate * 100, 2),
+            "Total Return": round(total_return, 2),
+            "Max Drawdown": round(max_dd, 2),
+            "Total Signals": total_trades
+        }
+
+    def _equity_curve(self, df: pd.DataFrame, indicator: str, horizon: int = 3, initial_capital: float = 1000.0, fee_rate: float = 0.001, stop_loss: float = 0.02, take_profit: float = 0.04, trailing_stop: float = 0.0) -> np.ndarray:
+        """Run the trade simulation and return the equity curve as an ndarray."""
+        sig_col = f'{indicator}_Signal'
+        return _simulate_pnl(
+            df['close'].to_numpy(dtype=np.float64),
+            df['high'].to_numpy(dtype=np.float64),
+            df['low'].to_numpy(dtype=np.float64),
+            df[sig_col].to_numpy(dtype=np.float64),
+            horizon, stop_loss, take_profit, trailing_stop, fee_rate, initial_capital
+        )
+
     def calculate_pnl_curve(self, df: pd.DataFrame, indicator: str, horizon: int = 3, initial_capital: float = 1000.0, fee_rate: float = 0.001, stop_loss: float = 0.02, take_profit: float = 0.04, trailing_stop: float = 0.0) -> pd.DataFrame:
         """
         Simulate a trade strategy: Enter on Signal, Exit after 'horizon' candles OR Stop Loss / Take Profit / Trailing Stop.
-        Returns a DataFrame with 'Equity' curve.
+        Returns a DataFrame with 'Equity' curve (the copy is for UI callers
+        that annotate the frame further; run_backtest uses _equity_curve).
         Includes Trading Fees (default 0.1% per trade).
         """
         df = df.copy()
-        df['Equity'] = initial_capital
-        capital = initial_capital
-        position = 0 # 0: None, 1: Long, -1: Short
-        entry_price = 0
-        exit_index = -1
-        
-        # For Trailing Stop
-        highest_high = 0
-        lowest_low = 0
-        
-        sig_col = f'{indicator}_Signal'
-        equity_curve = []
-        
-        # Simple loop simulation
-        for i in range(len(df)):
-            # Check for exit first (SL/TP/TS or Time-based)
-            if position != 0:
-                current_low = df['low'].iloc[i]
-                current_high = df['high'].iloc[i]
-                current_close = df['close'].iloc[i]
-                
-                # Update High/Low for Trailing Stop
-                if position == 1:
-                    highest_high = max(highest_high, current_high)
-                elif position == -1:
-                    lowest_low = min(lowest_low, current_low)
-                
-                exit_price = 0
-                exit_reason = "" # 'SL', 'TP', 'TS', 'Time'
-                
-                # Check SL/TP/TS
-                if position == 1: # Long
-                    sl_price = entry_price * (1 - stop_loss)
-                    tp_price = entry_price * (1 + take_profit)
-                    ts_price = highest_high * (1 - trailing_stop)
-                    
-                    if stop_loss > 0 and current_low <= sl_price:
-                        exit_price = sl_price
-                        exit_reason = "SL"
-                    elif trailing_stop > 0 and current_low <= ts_price:
-                        exit_price = ts_price
-                        exit_reason = "TS"
-                    elif take_profit > 0 and current_high >= tp_price:
-                        exit_price = tp_price
-                        exit_reason = "TP"
-                    elif i == exit_index:
-                        exit_price = current_close
-                        exit_reason = "Time"
-                        
-                elif position == -1: # Short
-                    sl_price = entry_price * (1 + stop_loss)
-                    tp_price = entry_price * (1 - take_profit)
-                    ts_price = lowest_low * (1 + trailing_stop)
-                    
-                    if stop_loss > 0 and current_high >= sl_price:
-                        exit_price = sl_price
-                        exit_reason = "SL"
-                    elif trailing_stop > 0 and current_high >= ts_price:
-                        exit_price = ts_price
-                        exit_reason = "TS"
-                    elif take_profit > 0 and current_low <= tp_price:
-                        exit_price = tp_price
-                        exit_reason = "TP"
-                    elif i == exit_index:
-                        exit_price = current_close
-                        exit_reason = "Time"
-                
-                # Execute Exit if triggered
-                if exit_reason != "":
-                    # Calculate Gross PnL
-                    if position == 1:
-                        gross_pnl = (exit_price - entry_price) / entry_price
-                    else:
-                        gross_pnl = (entry_price - exit_price) / entry_price
-                    
-                    capital *= (1 + gross_pnl) * ((1 - fee_rate) ** 2)
-                    position = 0
-            
-            # Check for entry (if no position)
-            if position == 0 and i < len(df) - horizon:
-                signal = df[sig_col].iloc[i]
-                if signal == 1: # Buy
-                    position = 1
-                    entry_price = df['close'].iloc[i]
-                    highest_high = entry_price # Init for TS
-                    exit_index = i + horizon
-                elif signal == -1: # Sell
-                    position = -1
-                    entry_price = df['close'].iloc[i]
-                    lowest_low = entry_price # Init for TS
-                    exit_index = i + horizon
-            
-            equity_curve.append(capital)
-            
-        df['Equity'] = equity_curve
+        df['Equity'] = self._equity_curve(df, indicator, horizon=horizon, initial_capital=initial_capital, fee_rate=fee_rate, stop_loss=stop_loss, take_profit=take_profit, trailing_stop=trailing_stop)
         return df
 
 if __name__ == "__main__":
@@ -1,23 +1,44 @@
 import requests
 import pandas as pd
+import numpy as np
 from datetime import datetime
 import time
 
+# orjson 解析多 MB 的 JSON 明显快于标准库; 未安装时退回 response.json()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class BridgeFlowMonitor:
     def __init__(self):
         self.api_url = "https://bridges.llama.fi/bridges?includeChains=true"
+        # 复用连接池 + gzip, 省掉每次请求的 TCP/TLS 握手和未压缩传输
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0', 'Accept-Encoding': 'gzip'})
+        self._cache = (0.0, None)  # (fetched_at, bridges)
 
     def get_bridge_data(self):
+        # 该接口更新频率很低, 30 秒内直接复用上次结果
+        cached_at, cached = self._cache
+        if cached is not None and time.time() - cached_at < 30:
+            return cached
+
         try:
             print(f"[{datetime.now().strftime('%H:%M:%S')}] 正在获取跨链桥数据...")
-            headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(self.api_url, headers=headers, timeout=20)
+            response = self.session.get(self.api_url, timeout=20)
             response.raise_for_status()
-            data = response.json()
-            
-            if 'bridges' in data: return data['bridges']
-            if 'data' in data and 'bridges' in data['data']: return data['data']['bridges']
-            return []
+            data = orjson.loads(response.content) if orjson else response.json()
+
+            if 'bridges' in data:
+                bridges = data['bridges']
+            elif 'data' in data and 'bridges' in data['data']:
+                bridges = data['data']['bridges']
+            else:
+                bridges = []
+
+            self._cache = (time.time(), bridges)
+            return bridges
         except Exception as e:
             print(f"❌ API 请求失败: {e}")
             return []
@@ -26,60 +47,66 @@ class BridgeFlowMonitor:
         bridges = self.get_bridge_data()
         if not bridges: return pd.DataFrame()
 
-        results = []
-
-        for b in bridges:
-            name = b.get('displayName', 'Unknown')
-            
-            # 1. 获取交易量
-            vol_24h = b.get('lastDailyVolume')
-            if vol_24h is None:
-                vol_24h = b.get('last24hVolume', 0)
-            
-            # 异常值过滤：如果单个桥日交易量 > 100亿美金，肯定是数据错误
-            if vol_24h > 10_000_000_000: continue
-
-            vol_prev = b.get('dayBeforeLastVolume', 0)
-            if vol_prev is None: vol_prev = 0
-            
-            vol_7d = b.get('weeklyVolume', 0)
-            
-            # 2. 计算变化率 (优化版)
-            vol_change_pct = 0
-            
-            # 仅当昨日交易量 > $50,000 时才计算百分比
-            # 避免 "从 $100 变成 $10,000,000" 这种无意义的百万倍增长
-            if vol_prev > 50000:
-                vol_change_pct = ((vol_24h - vol_prev) / vol_prev) * 100
-            elif vol_prev <= 50000 and vol_24h > 1000000:
-                # 如果是新启动的桥 (昨日没量，今日爆发)，给一个固定的高分
-                vol_change_pct = 999.0 
-            
-            # 数值封顶：为了图表好看，最大只显示 +2000%
-            # 原始数据可以保留在 tooltip，但用于排序和画图的列我们要处理一下
-            display_change_pct = min(vol_change_pct, 2000.0)
-
-            chains = b.get('chains', [])
-            if chains:
-                short_chains = [c.replace('Ethereum', 'Eth').replace('Arbitrum', 'Arb').replace('Optimism', 'Op') for c in chains]
-                if len(short_chains) > 3:
-                    chains_str = f"{', '.join(short_chains[:3])} (+{len(short_chains)-3})"
-                else:
-                    chains_str = ", ".join(short_chains)
-            else:
-                chains_str = "-"
-
-            results.append({
-                'Bridge': name,
-                'Chains': chains_str,
-                'Volume (24h)': vol_24h,
-                # 我们存入处理过的百分比，避免 UI 爆炸
-                'Vol Change (24h)': display_change_pct, 
-                'Volume (7d)': vol_7d,
-                'Trend': self.get_trend_label(vol_24h, display_change_pct)
-            })
-
-        return pd.DataFrame(results)
+        # 一次性建表, 数值列全部向量化处理 (替代逐桥 Python 循环)
+        df = pd.json_normalize(bridges)
+        for col in ('lastDailyVolume', 'last24hVolume', 'dayBeforeLastVolume', 'weeklyVolume'):
+            if col not in df.columns:
+                df[col] = 0
+        if 'displayName' not in df.columns: df['displayName'] = 'Unknown'
+        if 'chains' not in df.columns: df['chains'] = None
+
+        vol_24h = pd.to_numeric(df['lastDailyVolume'], errors='coerce')
+        vol_24h = vol_24h.fillna(pd.to_numeric(df['last24hVolume'], errors='coerce')).fillna(0)
+
+        # 异常值过滤：如果单个桥日交易量 > 100亿美金，肯定是数据错误
+        keep = vol_24h <= 10_000_000_000
+        df = df[keep]
+        v24 = vol_24h[keep].to_numpy()
+        vp = pd.to_numeric(df['dayBeforeLastVolume'], errors='coerce').fillna(0).to_numpy()
+        v7d = pd.to_numeric(df['weeklyVolume'], errors='coerce').fillna(0).to_numpy()
+
+        # 计算变化率:
+        # 仅当昨日交易量 > $50,000 时才计算百分比
+        # 避免 "从 $100 变成 $10,000,000" 这种无意义的百万倍增长
+        # 如果是新启动的桥 (昨日没量，今日爆发)，给一个固定的高分
+        vol_change_pct = np.where(
+            vp > 50000,
+            (v24 - vp) / np.where(vp > 50000, vp, 1) * 100,
+            np.where(v24 > 1_000_000, 999.0, 0.0)
+        )
+
+        # 数值封顶：为了图表好看，最大只显示 +2000%
+        display_change_pct = np.minimum(vol_change_pct, 2000.0)
+
+        # get_trend_label 的向量化版本
+        trend = np.select(
+            [
+                v24 > 50_000_000,
+                (v24 > 10_000_000) & (display_change_pct > 30),
+                (v24 > 1_000_000) & (v24 <= 10_000_000) & (display_change_pct > 100),
+                display_change_pct < -50,
+            ],
+            ["🐋 Whale Mov", "🚀 Hot Flow", "👀 New Trend?", "❄️ Cooling"],
+            default="Stable"
+        )
+
+        return pd.DataFrame({
+            'Bridge': df['displayName'].fillna('Unknown').to_numpy(),
+            'Chains': [self._format_chains(c) for c in df['chains']],
+            'Volume (24h)': v24,
+            # 我们存入处理过的百分比，避免 UI 爆炸
+            'Vol Change (24h)': display_change_pct,
+            'Volume (7d)': v7d,
+            'Trend': trend,
+        })
+
+    def _format_chains(self, chains):
+        if not isinstance(chains, list) or not chains:
+            return "-"
+        short_chains = [c.replace('Ethereum', 'Eth').replace('Arbitrum', 'Arb').replace('Optimism', 'Op') for c in chains]
+        if len(short_chains) > 3:
+            return f"{', '.join(short_chains[:3])} (+{len(short_chains)-3})"
+        return ", ".join(short_chains)
 
     def get_trend_label(self, vol, change):
         if vol > 50_000_000: return "🐋 Whale Mov"
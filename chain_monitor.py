@@ -9,14 +9,29 @@ Ethereum Chain Monitor - 链上风险监控模块
 """
 
 import time
+import asyncio
+import bisect
 import requests
-import numpy as np
-from web3 import Web3
+from collections import deque
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 from termcolor import cprint
 
+# orjson (C 实现) 解析 JSON 比标准库快 3-5 倍; 未安装时退回 resp.json()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(resp):
+    return orjson.loads(resp.content) if orjson else resp.json()
+
+
 # ============================================================================
 # 配置
 # ============================================================================
@@ -50,13 +65,21 @@ MEV_BUNDLE_THRESHOLD = 10      # 单个区块包含超过 10 个 MEV bundles
 # 异常检测
 HIGH_FAIL_RATE = 0.3           # 区块内交易失败率超过 30%
 SUSPICIOUS_GAS_THRESHOLD = 25000000  # 可疑高 Gas 消耗阈值
+
 MIN_TX_FOR_SUSPICION = 50      # 低交易数阈值
 
+# Gas/MEV 分级查表: bisect 二分代替 if/elif 级联, 阈值与标签一一对应
+_GAS_BOUNDS = (GAS_LOW_THRESHOLD, 30, GAS_EXTREME_THRESHOLD)
+_GAS_LABELS = ("low", "normal", "high", "extreme")
+_MEV_BOUNDS = (5, MEV_BUNDLE_THRESHOLD)
+_MEV_LABELS = ("normal", "elevated", "high")
+
 # ============================================================================
 # 数据类
 # ============================================================================
 
-@dataclass
+# slots=True: 每区块都会实例化, 免去实例 __dict__, 创建更快、内存更省
+@dataclass(slots=True)
 class BlockMetrics:
     """区块指标"""
     block_number: int
@@ -74,7 +97,7 @@ class BlockMetrics:
             self.alerts = []
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkStatus:
     """网络状态"""
     is_congested: bool
@@ -96,13 +119,46 @@ class ChainMonitor:
     def __init__(self, rpc_url: str = RPC_URL):
         self.rpc_url = rpc_url
         self.w3 = None
-        self.gas_history: List[float] = []
-        self.block_history: List[BlockMetrics] = []
+        # Gas 历史用有界 deque + 运行求和, 均值 O(1) 且热路径不再依赖 numpy
+        self.gas_history: deque = deque(maxlen=10)
+        self._gas_sum = 0.0
+        # 区块历史同样有界: deque 追加即自动淘汰最旧项, 无 pop(0) 搬移
+        self.block_history: deque = deque(maxlen=100)
         self.connected = False
+        # 共享连接池: Flashbots/Beacon/Etherscan/RPC 复用 keep-alive 连接,
+        # 省掉每次调用的 TCP+TLS 握手
+        self.http = requests.Session()
+        # 超时统一用 (连接, 读取) 二元组: 慢 TLS 握手 1s 即失败重试,
+        # 不再占用整个读取预算
+        # 瞬态 429/5xx 在同一条 keep-alive 连接上指数退避重试,
+        # 而不是静默失败后干等下一个轮询周期
+        self.http.mount("https://", HTTPAdapter(
+            pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(
+                total=2, backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(['GET'])
+            )
+        ))
+        # 并发执行互相独立的外部 API 调用 (都是 I/O 等待)
+        self._pool = ThreadPoolExecutor(max_workers=4)
+        # 短 TTL 缓存: Etherscan 预言机约 10s 更新一次, Beacon epoch 约 6.4 分钟;
+        # 历史区块的 MEV bundle 数不可变, 按区块号缓存 (有界)
+        self._gas_oracle_cache = (0.0, None)
+        self._validator_cache = (0.0, None)
+        self._mev_cache: Dict[int, tuple] = {}
+        # 已终局区块的分析结果不可变, 按区块号缓存; 记录见过的最高区块号,
+        # 以免缓存可能仍被重组的链头区块
+        self._block_cache: Dict[int, BlockMetrics] = {}
+        self._last_head = 0
+        # eth_blockNumber 轮询结果短暂记忆 (时间戳, 区块号), TTL 为半个出块时间
+        self._head_memo = (0.0, 0)
         
     def connect(self) -> bool:
         """连接到 RPC 节点"""
         try:
+            # 延迟导入: web3 加载很重, 只在真正连接 RPC 时才付这笔启动成本
+            from web3 import Web3
             self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
             self.connected = self.w3.is_connected()
             if self.connected:
@@ -112,6 +168,40 @@ class ChainMonitor:
             cprint(f"[ERROR] 连接失败: {e}", "red")
             return False
     
+    def _rpc_batch(self, calls: List[tuple]) -> Optional[List[Any]]:
+        """
+        以 JSON-RPC 批量请求发送多个调用 (单次 HTTP 往返)。
+        calls: [(method, params), ...]，不要超过 10 个 (公共节点的常见上限)。
+        返回按请求顺序排列的 result 列表; 任一失败返回 None。
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        try:
+            resp = self.http.post(self.rpc_url, json=payload, timeout=(1.0, 10.0))
+            resp.raise_for_status()
+            data = _load_json(resp)
+            if not isinstance(data, list) or len(data) != len(calls):
+                return None
+            if any('result' not in r for r in data):
+                return None
+            data.sort(key=lambda r: r['id'])
+            return [r['result'] for r in data]
+        except Exception:
+            return None
+
+    @staticmethod
+    def _parse_raw_block(raw: Dict) -> Dict:
+        """把 JSON-RPC 原始区块的十六进制字段转成 int (只保留本模块用到的字段)"""
+        return {
+            'baseFeePerGas': int(raw.get('baseFeePerGas') or '0x0', 16),
+            'gasUsed': int(raw['gasUsed'], 16),
+            'gasLimit': int(raw['gasLimit'], 16),
+            'timestamp': int(raw['timestamp'], 16),
+            'transactions': raw.get('transactions', []),
+        }
+
     def get_current_gas_price(self) -> Optional[float]:
         """获取当前 Gas 价格 (Gwei)"""
         if not self.connected:
@@ -134,14 +224,15 @@ class ChainMonitor:
         gas_limit = block['gasLimit']
         utilization = (gas_used / gas_limit) * 100 if gas_limit > 0 else 0
         
-        # 更新 Gas 历史
+        # 更新 Gas 历史 (满时先把被挤出的值从运行和中扣掉)
+        if len(self.gas_history) == self.gas_history.maxlen:
+            self._gas_sum -= self.gas_history[0]
         self.gas_history.append(base_fee)
-        if len(self.gas_history) > 10:
-            self.gas_history.pop(0)
+        self._gas_sum += base_fee
         
         # 检测 Gas 突增
         if len(self.gas_history) >= 5:
-            avg_gas = np.mean(self.gas_history[:-1])  # 不包含当前值
+            avg_gas = (self._gas_sum - base_fee) / (len(self.gas_history) - 1)  # 不包含当前值
             if base_fee > avg_gas * GAS_SPIKE_THRESHOLD and avg_gas > 5:
                 alerts.append(f"⚠️ Gas 突增: {base_fee:.1f} Gwei (均值: {avg_gas:.1f})")
         
@@ -160,21 +251,30 @@ class ChainMonitor:
         通过 Flashbots 公共 API 检测 MEV 异常
         返回: (bundle_count, alerts)
         """
+        cached = self._mev_cache.get(block_number)
+        if cached is not None:
+            return cached
+
         alerts = []
         bundle_count = 0
         
         try:
             params = {'block_number': block_number}
-            resp = requests.get(FLASHBOTS_API, params=params, timeout=3)
+            resp = self.http.get(FLASHBOTS_API, params=params, timeout=(1.0, 3.0))
             
             if resp.status_code == 200:
-                data = resp.json()
+                data = _load_json(resp)
                 if data.get('blocks'):
                     block_data = data['blocks'][0]
                     bundle_count = int(block_data.get('transactions_count', 0))
                     
                     if bundle_count > MEV_BUNDLE_THRESHOLD:
                         alerts.append(f"⚠️ MEV 活动激增: 区块 {block_number} 包含 {bundle_count} 个 bundles")
+
+                # 只缓存成功的响应 (失败/超时下次重试)
+                if len(self._mev_cache) >= 64:
+                    self._mev_cache.pop(next(iter(self._mev_cache)))
+                self._mev_cache[block_number] = (bundle_count, alerts)
         except requests.exceptions.Timeout:
             pass  # 忽略超时
         except Exception:
@@ -205,18 +305,24 @@ class ChainMonitor:
         """
         获取验证者状态 (使用 Beaconcha.in API)
         """
+        ts, cached = self._validator_cache
+        if cached is not None and time.monotonic() - ts < 60.0:
+            return cached
+
         try:
-            resp = requests.get(f"{BEACON_API}/epoch/latest", timeout=5)
+            resp = self.http.get(f"{BEACON_API}/epoch/latest", timeout=(1.0, 5.0))
             if resp.status_code == 200:
-                data = resp.json()
+                data = _load_json(resp)
                 if data.get('status') == 'OK':
                     epoch_data = data.get('data', {})
-                    return {
+                    result = {
                         'epoch': epoch_data.get('epoch'),
                         'validators_count': epoch_data.get('validatorscount'),
                         'participation_rate': epoch_data.get('globalparticipationrate'),
                         'finalized': epoch_data.get('finalized', False)
                     }
+                    self._validator_cache = (time.monotonic(), result)
+                    return result
         except Exception:
             pass
         return None
@@ -225,23 +331,29 @@ class ChainMonitor:
         """
         从 Etherscan 获取 Gas 预言机数据
         """
+        ts, cached = self._gas_oracle_cache
+        if cached is not None and time.monotonic() - ts < 8.0:
+            return cached
+
         try:
             params = {
                 'module': 'gastracker',
                 'action': 'gasoracle',
                 'apikey': ETHERSCAN_API_KEY
             }
-            resp = requests.get(ETHERSCAN_API, params=params, timeout=5)
+            resp = self.http.get(ETHERSCAN_API, params=params, timeout=(1.0, 5.0))
             if resp.status_code == 200:
-                data = resp.json()
+                data = _load_json(resp)
                 if data.get('status') == '1':
                     result = data.get('result', {})
-                    return {
+                    oracle = {
                         'safe_gas': float(result.get('SafeGasPrice', 0)),
                         'propose_gas': float(result.get('ProposeGasPrice', 0)),
                         'fast_gas': float(result.get('FastGasPrice', 0)),
                         'base_fee': float(result.get('suggestBaseFee', 0))
                     }
+                    self._gas_oracle_cache = (time.monotonic(), oracle)
+                    return oracle
         except Exception:
             pass
         return None
@@ -254,17 +366,46 @@ class ChainMonitor:
             if not self.connect():
                 return None
         
+        if block_number is not None:
+            self._last_head = max(self._last_head, block_number)
+            cached = self._block_cache.get(block_number)
+            if cached is not None:
+                return cached
+
         try:
+            block = None
             if block_number is None:
-                block_number = self.w3.eth.block_number
-            
-            block = self.w3.eth.get_block(block_number, full_transactions=False)
+                # 批量 RPC: blockNumber + getBlock 合并成一次网络往返
+                batch = self._rpc_batch([
+                    ("eth_blockNumber", []),
+                    ("eth_getBlockByNumber", ["latest", False]),
+                ])
+                if batch is not None:
+                    block_number = int(batch[0], 16)
+                    block = self._parse_raw_block(batch[1])
+                else:
+                    block_number = self.w3.eth.block_number
+                self._last_head = max(self._last_head, block_number)
+
+            # MEV 查询 (检查前 2 个区块以应对延迟) 与区块获取互相独立,
+            # 先并发发出, 重叠两边的网络延迟
+            mev_future = self._pool.submit(self.check_mev_activity, block_number - 2)
+
+            if block is None:
+                # 直接走原始 provider 请求并自己解析十六进制字段, 跳过
+                # web3 AttributeDict 构造和中间件对每个字段的规范化
+                try:
+                    raw = self.w3.provider.make_request(
+                        'eth_getBlockByNumber', [hex(block_number), False]
+                    )['result']
+                    block = self._parse_raw_block(raw)
+                except Exception:
+                    block = self.w3.eth.get_block(block_number, full_transactions=False)
             
             # 检查网络拥堵
             base_fee, utilization, congestion_alerts = self.check_network_congestion(block)
             
-            # 检查 MEV 活动 (检查前 2 个区块以应对延迟)
-            mev_bundles, mev_alerts = self.check_mev_activity(block_number - 2)
+            mev_bundles, mev_alerts = mev_future.result()
             
             # 检查区块异常
             anomaly_alerts = self.check_block_anomalies(block)
@@ -285,10 +426,14 @@ class ChainMonitor:
                 alerts=all_alerts
             )
             
-            # 保存到历史
+            # 保存到历史 (deque 有界, 超出 maxlen 自动淘汰)
             self.block_history.append(metrics)
-            if len(self.block_history) > 100:
-                self.block_history.pop(0)
+
+            # 链头后面至少 2 个区块才视为不可变, 放入缓存
+            if block_number < self._last_head - 1:
+                if len(self._block_cache) >= 128:
+                    self._block_cache.pop(next(iter(self._block_cache)))
+                self._block_cache[block_number] = metrics
             
             return metrics
             
@@ -316,27 +461,13 @@ class ChainMonitor:
                 alerts=["⚠️ 无法获取网络状态"]
             )
         
-        # 计算平均 Gas
-        avg_gas = np.mean(self.gas_history) if self.gas_history else metrics.base_fee_gwei
+        # 计算平均 Gas (运行求和, O(1))
+        avg_gas = self._gas_sum / len(self.gas_history) if self.gas_history else metrics.base_fee_gwei
         
-        # 判断 Gas 水平
+        # 判断 Gas / MEV 水平 (查表)
         current_gas = metrics.base_fee_gwei
-        if current_gas < GAS_LOW_THRESHOLD:
-            gas_level = "low"
-        elif current_gas < 30:
-            gas_level = "normal"
-        elif current_gas < GAS_EXTREME_THRESHOLD:
-            gas_level = "high"
-        else:
-            gas_level = "extreme"
-        
-        # 判断 MEV 活动水平
-        if metrics.mev_bundles < 5:
-            mev_activity = "normal"
-        elif metrics.mev_bundles < MEV_BUNDLE_THRESHOLD:
-            mev_activity = "elevated"
-        else:
-            mev_activity = "high"
+        gas_level = _GAS_LABELS[bisect.bisect_right(_GAS_BOUNDS, current_gas)]
+        mev_activity = _MEV_LABELS[bisect.bisect_right(_MEV_BOUNDS, metrics.mev_bundles)]
         
         # 判断是否拥堵
         is_congested = metrics.utilization_pct > HIGH_UTILIZATION or gas_level in ["high", "extreme"]
@@ -354,6 +485,16 @@ class ChainMonitor:
             alerts=alerts
         )
     
+    def _poll_head(self, ttl: float = 6.0) -> int:
+        """带 TTL 的链头查询: 半个出块时间内复用上次结果, 省一半 eth_blockNumber"""
+        ts, head = self._head_memo
+        now = time.monotonic()
+        if now - ts < ttl:
+            return head
+        head = self.w3.eth.block_number
+        self._head_memo = (now, head)
+        return head
+
     def run_continuous(self, interval: int = 12):
         """
         持续监控模式（每个区块约 12 秒）
@@ -362,11 +503,12 @@ class ChainMonitor:
             return
         
         last_block = 0
+        next_tick = time.monotonic() + interval
         cprint(f"\n🔍 开始持续监控 (间隔: {interval}秒)...\n", "cyan")
         
         while True:
             try:
-                current_block = self.w3.eth.block_number
+                current_block = self._poll_head()
                 
                 if current_block > last_block:
                     metrics = self.analyze_block(current_block)
@@ -391,7 +533,14 @@ class ChainMonitor:
                     
                     last_block = current_block
                 
-                time.sleep(interval)
+                # 对齐到固定节拍: 扣除本轮分析的耗时, 避免轮询漂移导致
+                # 错过区块或对同一区块重复探测
+                now = time.monotonic()
+                if next_tick <= now:
+                    # 本轮耗时超过一个间隔, 重新对齐而不是连续补偿轮询
+                    next_tick = now + interval
+                time.sleep(next_tick - now)
+                next_tick += interval
                 
             except KeyboardInterrupt:
                 cprint("\n⏹️ 监控已停止", "cyan")
@@ -405,20 +554,8 @@ class ChainMonitor:
 # 单次检查函数（供外部调用）
 # ============================================================================
 
-def check_chain_health() -> Dict[str, Any]:
-    """
-    快速检查链上健康状态（供其他模块调用）
-    """
-    monitor = ChainMonitor()
-    if not monitor.connect():
-        return {
-            "success": False,
-            "error": "无法连接到 RPC"
-        }
-    
-    status = monitor.get_network_status()
-    gas_oracle = monitor.get_etherscan_gas_oracle()
-    
+def _build_health_report(monitor: ChainMonitor, status: NetworkStatus, gas_oracle: Optional[Dict]) -> Dict[str, Any]:
+    """把网络状态 + Gas 预言机组装成对外的健康报告"""
     return {
         "success": True,
         "timestamp": datetime.now().isoformat(),
@@ -439,11 +576,51 @@ def check_chain_health() -> Dict[str, Any]:
                 "util": m.utilization_pct,
                 "txs": m.tx_count
             }
-            for m in monitor.block_history[-5:]
+            for m in list(monitor.block_history)[-5:]
         ]
     }
 
 
+def check_chain_health() -> Dict[str, Any]:
+    """
+    快速检查链上健康状态（供其他模块调用）
+    """
+    monitor = ChainMonitor()
+    if not monitor.connect():
+        return {
+            "success": False,
+            "error": "无法连接到 RPC"
+        }
+    
+    # 网络状态 (内部访问 RPC + Flashbots) 与 Gas 预言机互相独立, 并发执行
+    status_future = monitor._pool.submit(monitor.get_network_status)
+    oracle_future = monitor._pool.submit(monitor.get_etherscan_gas_oracle)
+    status = status_future.result()
+    gas_oracle = oracle_future.result()
+    
+    return _build_health_report(monitor, status, gas_oracle)
+
+
+async def acheck_chain_health() -> Dict[str, Any]:
+    """
+    check_chain_health 的异步版本, 供 async 调用方使用。
+    两个独立的阻塞调用通过 asyncio.to_thread 并发执行, 继续复用
+    ChainMonitor 现有的连接池会话, 而不是另起一套 aiohttp 客户端。
+    """
+    monitor = ChainMonitor()
+    if not await asyncio.to_thread(monitor.connect):
+        return {
+            "success": False,
+            "error": "无法连接到 RPC"
+        }
+
+    status, gas_oracle = await asyncio.gather(
+        asyncio.to_thread(monitor.get_network_status),
+        asyncio.to_thread(monitor.get_etherscan_gas_oracle),
+    )
+    return _build_health_report(monitor, status, gas_oracle)
+
+
 # ============================================================================
 # 主程序入口
 # ============================================================================
@@ -1,14 +1,20 @@
 import requests
-import ccxt
-import pandas as pd
-import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _get_json(url, params=None):
+    resp = requests.get(url, params=params)
+    return orjson.loads(resp.content) if orjson else resp.json()
 
 def debug_deribit():
     print("\n--- Debugging Deribit ---")
     url = "https://www.deribit.com/api/v2/public/get_volatility_index_data"
     params = {"currency": "BTC", "resolution": "1D"}
     try:
-        resp = requests.get(url, params=params).json()
+        resp = _get_json(url, params=params)
         print(f"Response Keys: {resp.keys()}")
         if 'result' in resp:
             print(f"Result Keys: {resp['result'].keys()}")
@@ -28,7 +34,7 @@ def debug_defillama():
     print("\n--- Debugging DefiLlama ---")
     url = "https://api.llama.fi/protocol/uniswap-v3"
     try:
-        resp = requests.get(url).json()
+        resp = _get_json(url)
         print(f"Response Keys: {resp.keys()}")
         
         if 'tvl' in resp:
@@ -52,6 +58,8 @@ def debug_defillama():
 
 def debug_binance_slippage():
     print("\n--- Debugging Binance Slippage ---")
+    import ccxt
+    import numpy as np
     exchange = ccxt.binance({'enableRateLimit': True})
     symbol = 'BTC/USDT'
     try:
@@ -60,21 +68,25 @@ def debug_binance_slippage():
         print(f"Mid Price: {mid_price}")
         
         target_amount = 100000
-        cost = 0
-        filled_qty = 0
         
         print("Simulating Buy...")
-        for i, (price, qty) in enumerate(book['asks']):
-            if cost + (price * qty) >= target_amount:
-                needed = (target_amount - cost) / price
-                filled_qty += needed
-                cost += needed * price
-                print(f"Order {i}: Price {price}, Taken {needed:.4f} (Partial), Total Cost {cost:.2f}")
-                break
-            else:
-                cost += price * qty
-                filled_qty += qty
-                # print(f"Order {i}: Price {price}, Taken {qty:.4f}, Total Cost {cost:.2f}")
+        # Vectorized sweep: cumulative cost per level + searchsorted for the
+        # fill level, instead of ~500 Python-dispatched iterations
+        asks = np.asarray(book['asks'], dtype=np.float64)
+        prices, qtys = asks[:, 0], asks[:, 1]
+        cum_cost = np.cumsum(prices * qtys)
+        idx = int(np.searchsorted(cum_cost, target_amount))
+        
+        if idx >= len(prices):
+            # Book too shallow for the target notional: full sweep
+            filled_qty = qtys.sum()
+            cost = cum_cost[-1]
+        else:
+            prior_cost = cum_cost[idx - 1] if idx > 0 else 0.0
+            needed = (target_amount - prior_cost) / prices[idx]
+            filled_qty = qtys[:idx].sum() + needed
+            cost = target_amount
+            print(f"Order {idx}: Price {prices[idx]}, Taken {needed:.4f} (Partial), Total Cost {cost:.2f}")
         
         avg_price = cost / filled_qty
         slippage = (avg_price - mid_price) / mid_price * 100
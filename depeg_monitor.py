@@ -1,12 +1,31 @@
+import bisect
 import requests
-import pandas as pd
 from datetime import datetime
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson 解析更快且分配更少; 未安装时退回 response.json()
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class DepegMonitor:
     def __init__(self):
         # 使用 DefiLlama Price API (无限制，最稳定)
         self.api_url = "https://coins.llama.fi/prices/current"
+
+        # 复用连接池, 避免每次轮询重新 TCP/TLS 握手
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(
+            pool_connections=2, pool_maxsize=4,
+            max_retries=Retry(
+                total=2, backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(['GET'])
+            )
+        ))
         
         self.warning_threshold = 0.3   
         self.critical_threshold = 1.0  
@@ -25,25 +44,34 @@ class DepegMonitor:
             'crvUSD':{'id': 'coingecko:crvusd',            'peg': 1.0},
         }
 
+        # targets 运行期不变, 查询 URL 在这里拼好一次即可
+        self._query_url = f"{self.api_url}/{','.join(info['id'] for info in self.targets.values())}"
+
+        # 状态分档表: bisect 找档位, 再按折价/溢价取 (status, risk_score)
+        self._status_bounds = (self.warning_threshold, self.critical_threshold)
+        self._status_table = (
+            {False: ("✅ Stable", 0),       True: ("✅ Stable", 0)},
+            {False: ("🔵 Premium", 0),      True: ("⚠️ Discount", 2)},
+            {False: ("📈 HIGH PREMIUM", 1), True: ("🚨 CRITICAL DIP", 3)},
+        )
+
     def get_market_data(self):
         print(f"[{datetime.now().strftime('%H:%M:%S')}] 正在获取稳定币价格 (Source: DefiLlama)...")
         
-        query_ids = ",".join([info['id'] for info in self.targets.values()])
-        url = f"{self.api_url}/{query_ids}"
-        
         try:
             # searchWidth=4h 确保数据连贯性
-            response = requests.get(url, params={'searchWidth': '4h'}, timeout=10)
+            response = self.http.get(self._query_url, params={'searchWidth': '4h'}, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if orjson else response.json()
             return data.get('coins', {})
         except Exception as e:
             print(f"❌ 获取价格失败: {e}")
             return {}
 
     def analyze_pegs(self):
+        """逐币计算锚定偏差, 返回 list[dict]; 轮询热路径不构造 DataFrame"""
         coins_data = self.get_market_data()
-        if not coins_data: return pd.DataFrame()
+        if not coins_data: return []
 
         results = []
         
@@ -61,24 +89,9 @@ class DepegMonitor:
             diff = current_price - target_peg
             deviation_pct = (abs(diff) / target_peg) * 100
             
-            # 状态判定
-            status = "✅ Stable"
-            risk_val = 0
-            
-            if deviation_pct >= self.critical_threshold:
-                if diff < 0:
-                    status = "🚨 CRITICAL DIP"
-                    risk_val = 3
-                else:
-                    status = "📈 HIGH PREMIUM"
-                    risk_val = 1
-            elif deviation_pct >= self.warning_threshold:
-                if diff < 0:
-                    status = "⚠️ Discount"
-                    risk_val = 2
-                else:
-                    status = "🔵 Premium"
-                    risk_val = 0
+            # 状态判定: 按偏差分档查表 (档位 x 折价/溢价)
+            tier = bisect.bisect_right(self._status_bounds, deviation_pct)
+            status, risk_val = self._status_table[tier][diff < 0]
             
             results.append({
                 'Asset': symbol,
@@ -92,12 +105,23 @@ class DepegMonitor:
                 'risk_score': risk_val 
             })
 
+        return results
+
+    def to_dataframe(self, results=None):
+        """仅在展示/打印时物化为 DataFrame"""
+        # 延迟导入: 只有展示路径需要 pandas
+        import pandas as pd
+        if results is None:
+            results = self.analyze_pegs()
         return pd.DataFrame(results)
 
 if __name__ == "__main__":
     monitor = DepegMonitor()
-    df = monitor.analyze_pegs()
-    if not df.empty:
-        print(df.to_string())
+    results = monitor.analyze_pegs()
+    if results:
+        # CLI 下直接 f-string 打表, 不值得为格式化拉起整个 pandas
+        print(f"{'Asset':<8}{'Price':<12}{'Dev %':<10}Status")
+        for row in results:
+            print(f"{row['Asset']:<8}{row['Price']:<12.4f}{row['Dev %']:<10.3f}{row['Status']}")
     else:
         print("⚠️ 未获取到数据")
\ No newline at end of file
@@ -2,50 +2,83 @@ import ccxt
 import requests
 import pandas as pd
 from datetime import datetime
-import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-class DerivativesRiskMonitor:
-    def __init__(self, api_key: str = None):
-        self.api_key = api_key
-        self.exchange = ccxt.binance({
+# Process-wide ccxt instances, one per API key: constructing ccxt.binance
+# and loading its markets is expensive, and every monitor instantiation
+# (each Streamlit rerun creates one) was paying it again
+_EXCHANGES = {}
+
+def _get_exchange(api_key: str = None):
+    exchange = _EXCHANGES.get(api_key)
+    if exchange is None:
+        exchange = ccxt.binance({
             'enableRateLimit': True,
             'apiKey': api_key, # Optional for some endpoints
             'options': {'defaultType': 'future'} # 强制使用合约API
         })
+        exchange.load_markets()
+        _EXCHANGES[api_key] = exchange
+    return exchange
+
+
+class DerivativesRiskMonitor:
+    def __init__(self, api_key: str = None):
+        self.api_key = api_key
         self.fapi_base = "https://fapi.binance.com"
 
+        # Shared keep-alive session for Binance/Bybit REST calls; retries
+        # transient throttling instead of failing straight to the fallback
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": "Mozilla/5.0"})
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(
+                total=2, backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(['GET'])
+            )
+        ))
+
+    @property
+    def exchange(self):
+        # Lazy: the hot path no longer touches ccxt, so markets only load
+        # when something actually needs the full exchange object
+        return _get_exchange(self.api_key)
+
     def get_basic_metrics(self, symbol: str = 'BTC/USDT'):
         """
         获取 Funding Rate 和 Open Interest
         """
         try:
-            # Ensure symbol format for CCXT
             if '/' not in symbol:
                 symbol = f"{symbol}/USDT"
-            
-            # 1. Fetch Funding Rate
-            funding_info = self.exchange.fetch_funding_rate(symbol)
-            
-            # 2. Fetch Open Interest
-            # Use ccxt method which handles the endpoint correctly
-            oi_info = self.exchange.fetch_open_interest(symbol)
-            oi_val = float(oi_info.get('openInterestAmount') or 0)
-            oi_usd = float(oi_info.get('openInterestValue') or 0) # Notional Value
-            
-            # If value is 0, try to calculate
-            if oi_usd == 0 and oi_val > 0:
-                mark_price = float(funding_info.get('markPrice') or 0)
-                if mark_price == 0:
-                     ticker = self.exchange.fetch_ticker(symbol)
-                     mark_price = float(ticker['last'])
-                oi_usd = oi_val * mark_price
+            raw_symbol = symbol.replace('/', '')
+
+            # Hit the fapi endpoints directly: for a single symbol ccxt's
+            # load_markets + rate-limit sleeps cost far more than the two
+            # small GETs themselves
+            pi = self.session.get(
+                f"{self.fapi_base}/fapi/v1/premiumIndex",
+                params={"symbol": raw_symbol}, timeout=(2.0, 3.0)).json()
+            oi = self.session.get(
+                f"{self.fapi_base}/fapi/v1/openInterest",
+                params={"symbol": raw_symbol}, timeout=(2.0, 3.0)).json()
+
+            # premiumIndex always carries markPrice on fapi, so no extra
+            # ticker round trip is needed on a degraded response
+            mark_price = float(pi.get('markPrice') or 0)
+            funding_rate = float(pi.get('lastFundingRate') or 0)
+            oi_val = float(oi.get('openInterest') or 0)
 
             return {
                 "symbol": symbol,
-                "price": float(funding_info.get('markPrice') or 0),
-                "funding_rate_cur": funding_info['fundingRate'],
-                "funding_rate_annualized": funding_info['fundingRate'] * 3 * 365 * 100,
-                "open_interest_usd": oi_usd
+                "price": mark_price,
+                "funding_rate_cur": funding_rate,
+                "funding_rate_annualized": funding_rate * 3 * 365 * 100,
+                "open_interest_usd": oi_val * mark_price
             }
         except Exception as e:
             return {"error": f"Basic metrics failed for {symbol}: {str(e)}"}
@@ -64,8 +97,7 @@ class DerivativesRiskMonitor:
             
             url = f"{self.fapi_base}/fapi/v1/topLongShortAccountRatio"
             params = {"symbol": raw_symbol, "period": period, "limit": 1}
-            headers = {"User-Agent": "Mozilla/5.0"}
-            resp = requests.get(url, params=params, headers=headers, timeout=2).json()
+            resp = self.session.get(url, params=params, timeout=(2.0, 3.0)).json()
             
             if isinstance(resp, list) and len(resp) > 0:
                 data = resp[0]
@@ -93,7 +125,7 @@ class DerivativesRiskMonitor:
                 "period": "5min",
                 "limit": 1
             }
-            resp = requests.get(url, params=params, timeout=5).json()
+            resp = self.session.get(url, params=params, timeout=(2.0, 5.0)).json()
             
             if resp['retCode'] == 0 and resp['result']['list']:
                 data = resp['result']['list'][0]
@@ -123,14 +155,9 @@ class DerivativesRiskMonitor:
                 "symbol": symbol.replace('/', ''),
                 "limit": 20
             }
-            # Some public endpoints work without key but need User-Agent
-            headers = {
-                "User-Agent": "Mozilla/5.0",
-            }
-            if self.api_key:
-                headers["X-MBX-APIKEY"] = self.api_key
-
-            resp = requests.get(url, params=params, headers=headers).json()
+            # Session already carries the User-Agent; only the key is per-call
+            headers = {"X-MBX-APIKEY": self.api_key} if self.api_key else None
+            resp = self.session.get(url, params=params, headers=headers, timeout=(2.0, 5.0)).json()
             
             if isinstance(resp, dict) and 'code' in resp and resp['code'] == -2014:
                  return {"error": "Liquidation data requires API Key (Private Endpoint)"}
@@ -166,8 +193,16 @@ class DerivativesRiskMonitor:
         
         print(f"--- Derivatives Risk Report: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---")
         
+        # The three sections hit independent endpoints; fetch them in
+        # parallel so the report costs ~1 round trip instead of 4-5.
+        # Each getter already traps its own failures into an error dict.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            basic_f = pool.submit(self.get_basic_metrics, target_symbol_ccxt)
+            ls_f = pool.submit(self.get_long_short_ratio, target_symbol_raw)
+            liq_f = pool.submit(self.get_recent_liquidations, target_symbol_raw)
+            basic, ls_data, liq_data = basic_f.result(), ls_f.result(), liq_f.result()
+
         # 1. Basic Leverage Metrics
-        basic = self.get_basic_metrics(target_symbol_ccxt)
         if "error" in basic:
             print(f"Error fetching basic metrics: {basic['error']}")
         else:
@@ -178,7 +213,6 @@ class DerivativesRiskMonitor:
             print(f"Open Interest: ${basic.get('open_interest_usd', 0):,.0f}")
 
         # 2. Sentiment (L/S Ratio)
-        ls_data = self.get_long_short_ratio(target_symbol_raw)
         if "error" in ls_data:
             print(f"Error fetching L/S Ratio: {ls_data['error']}")
         else:
@@ -188,7 +222,6 @@ class DerivativesRiskMonitor:
             print(f"Short Accounts: {ls_data.get('short_account_pct')}%")
 
         # 3. Liquidation Pressure
-        liq_data = self.get_recent_liquidations(target_symbol_raw)
         if "error" in liq_data:
             print(f"Error fetching liquidations: {liq_data['error']}")
         else:
@@ -1,13 +1,46 @@
 import requests
 import pandas as pd
-import time
 from datetime import datetime
+import gzip
+import json
 import os
+import socket
+import threading
+import time
+
+# orjson 解析更快且分配更少; 未安装时退回标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 磁盘缓存目录 (与 backtest_engine 共用); DefiLlama 储备快照几分钟才更新一次
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'crypto-alpha-terminal')
+CACHE_TTL = 600  # 秒
+
 
 class CEXReserveMonitor:
     def __init__(self):
         self.base_url = "https://api.llama.fi"
-        
+
+        # 共享连接池: 各交易所请求复用 keep-alive 连接, 429/5xx 指数退避重试;
+        # 被限流时优先遵循服务端 Retry-After, 而不是固定节奏盲等.
+        # 并发上限由 run_monitor 的 8 线程池兜底, 无需再加令牌桶
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=8, pool_maxsize=16,
+            max_retries=Retry(
+                total=5, backoff_factor=0.5,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(['GET']),
+                respect_retry_after_header=True
+            )
+        ))
+
         # 1. 修正交易所列表，Huobi 改为 'htx'
         self.target_exchanges = [
             'binance-cex', 
@@ -36,16 +69,75 @@ class CEXReserveMonitor:
         # 目标监控资产
         self.target_tokens = ['USDT', 'USDC', 'DAI', 'ETH', 'BTC']
 
+        # 后台预热 DNS: 第一条连接建立时解析结果已在系统缓存里,
+        # 解析慢/被墙的环境不会把首个请求也拖住
+        threading.Thread(target=self._warm_dns, daemon=True).start()
+
+    @staticmethod
+    def _warm_dns():
+        try:
+            socket.gethostbyname_ex('api.llama.fi')
+        except OSError:
+            pass  # 解析失败交给正式请求去报错
+
+    # 常见别名映射, 归并到目标资产; 类级常量, 不随每次聚合重建
+    ALIAS = {'WETH': 'ETH', 'STETH': 'ETH', 'BETH': 'ETH',
+             'WBTC': 'BTC', 'CBTC': 'BTC', 'BTCB': 'BTC'}
+
+    def _cache_path(self, slug):
+        return os.path.join(CACHE_DIR, f"cex_{slug}.json.gz")
+
+    @staticmethod
+    def _prune_payload(data):
+        """只保留最新快照: /protocol 响应携带数年的历史 tvl/tokens 序列,
+        而 run_monitor 只消费每条序列的最后一项"""
+        pruned = {}
+        chain_tvls = data.get('chainTvls')
+        if isinstance(chain_tvls, dict):
+            pruned['chainTvls'] = {
+                chain: {'tokens': tokens[-1:] if isinstance(
+                    (tokens := details.get('tokens')), list) else tokens}
+                for chain, details in chain_tvls.items()
+            }
+        if 'tokens' in data:
+            tokens = data['tokens']
+            pruned['tokens'] = tokens[-1:] if isinstance(tokens, list) else tokens
+        tvl = data.get('tvl')
+        pruned['tvl'] = tvl[-1:] if isinstance(tvl, list) else tvl
+        return pruned
+
     def get_exchange_details(self, slug):
+        # TTL 内直接读磁盘缓存: /protocol/<slug> 响应可达数 MB,
+        # 免去重复下载也减轻 DefiLlama 公共配额压力
+        cache_path = self._cache_path(slug)
+        try:
+            if time.time() - os.path.getmtime(cache_path) < CACHE_TTL:
+                with gzip.open(cache_path, 'rb') as f:
+                    raw = f.read()
+                return orjson.loads(raw) if orjson else json.loads(raw)
+        except (OSError, ValueError):
+            pass  # 无缓存或缓存损坏, 走网络
+
         try:
-            headers = {'User-Agent': 'Mozilla/5.0'}
             url = f"{self.base_url}/protocol/{slug}"
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, timeout=30)
             
             if response.status_code >= 400:
                 print(f"⚠️  [API Error] 无法找到: {slug} (Status: {response.status_code})")
                 return None
-            return response.json()
+            # 裁剪后再缓存: 磁盘文件和缓存命中时的重复解析都从 MB 级降到 KB 级
+            data = self._prune_payload(
+                orjson.loads(response.content) if orjson else response.json())
+
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with gzip.open(cache_path, 'wb') as f:
+                    f.write(orjson.dumps(data) if orjson
+                            else json.dumps(data).encode('utf-8'))
+            except OSError:
+                pass  # 缓存写失败不影响本次结果
+
+            return data
         except Exception as e:
             print(f"❌ [Net Error] 获取 {slug} 失败: {e}")
             return None
@@ -60,61 +152,70 @@ class CEXReserveMonitor:
             return latest.get('tokens', latest)
         return {}
 
+    def _aggregate_tokens(self, tokens_dicts):
+        """把若干 {token: amount} 快照归并成目标资产余额
+
+        别名归一 + 按币种求和走 pandas 的 C 级 groupby,
+        替代逐 token 的 Python 分支和字典累加
+        """
+        names, amounts = [], []
+        for tokens_dict in tokens_dicts:
+            names.extend(tokens_dict.keys())
+            amounts.extend(tokens_dict.values())
+        if not names:
+            return {t: 0.0 for t in self.target_tokens}, False
+
+        s = pd.Series(amounts, index=pd.Index(names).str.upper(), dtype='float64')
+        s = s.rename(self.ALIAS)  # rename 只改命中的标签
+        s = s.groupby(level=0).sum()
+        found = not s.index.intersection(self.target_tokens).empty
+        return s.reindex(self.target_tokens, fill_value=0.0).to_dict(), found
+
     def run_monitor(self):
         print(f"[{datetime.now().strftime('%H:%M:%S')}] 开始获取交易所储备数据 (DefiLlama CEX)...")
         all_reserves = []
 
-        for slug in self.target_exchanges:
-            name = self.name_mapping.get(slug, slug)
-            print(f"正在读取: {name}...")
-            
-            data = self.get_exchange_details(slug)
-            if not data: continue
+        # 纯 I/O 等待, 线程池并发抓取; 总耗时从 N 次往返降到约 1 次往返
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            fetched = pool.map(self.get_exchange_details, self.target_exchanges)
 
-            # 初始化余额 (这是数量，不是金额)
-            token_counts = {t: 0.0 for t in self.target_tokens}
-            found_data = False
-            
-            # 优先从 chainTvls 提取
-            if 'chainTvls' in data:
-                for chain, details in data['chainTvls'].items():
-                    raw_tokens = details.get('tokens')
-                    if raw_tokens:
-                        tokens_dict = self.extract_latest_tokens(raw_tokens)
-                        for t_name, amount in tokens_dict.items():
-                            clean = t_name.upper()
-                            # 常见别名映射
-                            if clean in ['WETH', 'STETH', 'BETH']: clean = 'ETH'
-                            if clean in ['WBTC', 'CBTC', 'BTCB']: clean = 'BTC'
-                            
-                            if clean in self.target_tokens:
-                                token_counts[clean] += float(amount)
-                                found_data = True
-            
-            # 备用：从根目录 tokens 提取
-            if not found_data and 'tokens' in data:
-                 tokens_dict = self.extract_latest_tokens(data['tokens'])
-                 for t_name, amount in tokens_dict.items():
-                    clean = t_name.upper()
-                    if clean in ['WETH']: clean = 'ETH'
-                    if clean in ['WBTC']: clean = 'BTC'
-                    if clean in self.target_tokens:
-                        token_counts[clean] += float(amount)
-
-            # 获取总资产 USD 价值 (这是 DefiLlama 算好的)
-            tvl_data = data.get('tvl', [])
-            total_usd = 0
-            if isinstance(tvl_data, list) and tvl_data:
-                total_usd = tvl_data[-1].get('totalLiquidityUSD', 0)
-            elif isinstance(tvl_data, (int, float)):
-                total_usd = tvl_data
-
-            row = {'Exchange': name, 'Total_Reserves_USD': total_usd}
-            row.update(token_counts)
-            all_reserves.append(row)
-            time.sleep(1)
-
-        return pd.DataFrame(all_reserves)
+            for slug, data in zip(self.target_exchanges, fetched):
+                name = self.name_mapping.get(slug, slug)
+                print(f"正在读取: {name}...")
+
+                if not data: continue
+
+                # 优先从 chainTvls 提取 (这是数量，不是金额)
+                snapshots = [
+                    self.extract_latest_tokens(details.get('tokens'))
+                    for details in data.get('chainTvls', {}).values()
+                    if details.get('tokens')
+                ]
+                token_counts, found_data = self._aggregate_tokens(snapshots)
+
+                # 备用：从根目录 tokens 提取
+                if not found_data and 'tokens' in data:
+                    token_counts, _ = self._aggregate_tokens(
+                        [self.extract_latest_tokens(data['tokens'])])
+
+                # 获取总资产 USD 价值 (这是 DefiLlama 算好的)
+                tvl_data = data.get('tvl', [])
+                total_usd = 0
+                if isinstance(tvl_data, list) and tvl_data:
+                    total_usd = tvl_data[-1].get('totalLiquidityUSD', 0)
+                elif isinstance(tvl_data, (int, float)):
+                    total_usd = tvl_data
+
+                # 定长元组代替字典行, 省掉构建 DataFrame 时的列并集推断
+                all_reserves.append((name, total_usd,
+                                     *(token_counts[t] for t in self.target_tokens)))
+
+        df = pd.DataFrame.from_records(
+            all_reserves,
+            columns=['Exchange', 'Total_Reserves_USD', *self.target_tokens])
+        if not df.empty:
+            df['Exchange'] = df['Exchange'].astype('category')
+        return df
 
 # --- 格式化显示函数 ---
 def format_usd_large(x):
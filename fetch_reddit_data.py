@@ -5,16 +5,24 @@ Run this script periodically (e.g., via cron) to fetch fresh Reddit data
 The Streamlit app will load data from the generated JSON file
 """
 
+import gzip
 import json
 from datetime import datetime
 from reddit_sentiment import RedditSentimentAnalyzer
 
+# orjson serializes to UTF-8 bytes in C, much faster than stdlib json
+# for indented dumps; fall back to json.dump when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def fetch_and_save_reddit_data(
     subreddit='CryptoCurrency',
     filter_type='hot',
     count=100,
     time_range=None,
-    output_file='reddit_data.json'
+    output_file='reddit_data.ndjson.gz'
 ):
     """
     Fetch Reddit data and save to JSON file
@@ -45,31 +53,35 @@ def fetch_and_save_reddit_data(
     posts = analyzer.analyze_posts(posts)
     print(f"[SUCCESS] Analyzed sentiments")
     
-    # Convert to JSON-serializable format
-    data = {
-        'fetch_time': datetime.now().isoformat(),
-        'subreddit': subreddit,
-        'filter_type': filter_type,
-        'count': len(posts),
-        'posts': []
-    }
-    
-    for post in posts:
-        data['posts'].append({
-            'id': post.id,
-            'title': post.title,
-            'selftext': post.selftext,
-            'upvotes': post.upvotes,
-            'num_comments': post.num_comments,
-            'created_utc': post.created_utc,
-            'url': post.url,
-            'sentiment_scores': post.sentiment_scores,
-            'detected_coins': post.detected_coins
-        })
-    
-    # Save to JSON
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Stream as gzipped NDJSON: a meta header line, then one JSON object
+    # per post, flushed as we go - peak memory stays at one post instead
+    # of the whole corpus plus its serialized string
+    def _dumps(obj):
+        if orjson:
+            return orjson.dumps(obj)
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    with gzip.open(output_file, 'wb') as f:
+        f.write(_dumps({
+            'fetch_time': datetime.now().isoformat(),
+            'subreddit': subreddit,
+            'filter_type': filter_type,
+            'count': len(posts)
+        }))
+        f.write(b'\n')
+        for post in posts:
+            f.write(_dumps({
+                'id': post.id,
+                'title': post.title,
+                'selftext': post.selftext,
+                'upvotes': post.upvotes,
+                'num_comments': post.num_comments,
+                'created_utc': post.created_utc,
+                'url': post.url,
+                'sentiment_scores': post.sentiment_scores,
+                'detected_coins': post.detected_coins
+            }))
+            f.write(b'\n')
     
     print(f"[SUCCESS] Data saved to {output_file}")
     print(f"[INFO] You can now load this data in Streamlit")
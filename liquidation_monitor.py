@@ -2,19 +2,63 @@ import asyncio
 import json
 import threading
 import time
-from collections import deque
+import numpy as np
 import websockets
 import ssl
 
+# orjson decodes websocket frames several times faster than stdlib json;
+# optional, stdlib fallback keeps the monitor working without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class LiquidationMonitor:
     def __init__(self):
         self.active_symbol = None
         self.running = False
         self.thread = None
         self.loop = None
-        self.liquidations = deque(maxlen=2000) # Store last 2000 events
+        # Last 2000 events as preallocated column arrays (ring buffer):
+        # one fixed block of memory instead of thousands of per-event dicts
+        self.N = 2000
+        self._time = np.empty(self.N, dtype=np.int64)
+        self._side = np.empty(self.N, dtype=np.uint8)  # 1 = SELL (long liq)
+        self._qty = np.empty(self.N, dtype=np.float64)
+        self._price = np.empty(self.N, dtype=np.float64)
+        self._amount = np.empty(self.N, dtype=np.float64)
+        self._head = 0
+        self._count = 0
         self.start_time = None
         self.lock = threading.Lock()
+        self._stop_event = None  # created inside the listener's event loop
+        self._queue = None       # bounded frame queue, also loop-local
+        self.dropped = 0         # frames discarded because the queue was full
+        # Running aggregates maintained on append/evict so get_stats is O(1)
+        # instead of walking the whole deque on every poll
+        self._reset_aggregates()
+
+    def _reset_aggregates(self):
+        self._head = 0
+        self._count = 0
+        self._total_vol = 0.0
+        self._long_vol = 0.0
+        self._short_vol = 0.0
+        self._long_count = 0
+        self._short_count = 0
+        self._publish_snapshot()
+
+    def _publish_snapshot(self):
+        # Immutable stats snapshot, swapped in one assignment (atomic under
+        # the GIL) so readers never need the writer's lock
+        self._snapshot = {
+            "count": self._count,
+            "long_count": self._long_count,
+            "short_count": self._short_count,
+            "vol": self._total_vol,
+            "long_vol": self._long_vol,
+            "short_vol": self._short_vol,
+        }
 
     def start(self, symbol: str):
         symbol = symbol.lower().replace('/', '')
@@ -32,7 +76,8 @@ class LiquidationMonitor:
         self.active_symbol = symbol
         self.running = True
         self.start_time = time.time()
-        self.liquidations.clear()
+        with self.lock:
+            self._reset_aggregates()
         
         # Start background thread
         self.thread = threading.Thread(target=self._run_loop, daemon=True)
@@ -40,19 +85,32 @@ class LiquidationMonitor:
         
     def stop(self):
         self.running = False
-        # We can't easily stop the loop from outside, but the loop checks self.running
+        # Signal the listener from outside its loop; it unblocks immediately
+        # instead of waiting for the next frame
+        if self.loop and self._stop_event:
+            self.loop.call_soon_threadsafe(self._stop_event.set)
         # Wait for thread to finish
         if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=0.1)
+            self.thread.join(timeout=1.0)
             
     def _run_loop(self):
         # Create a new loop for this thread
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        self.loop = loop
         loop.run_until_complete(self._listen())
         loop.close()
         
     async def _listen(self):
+        self._stop_event = asyncio.Event()
+        # Bounded queue decouples the socket reader from parsing: during a
+        # cascade the reader keeps draining the kernel buffer while the
+        # worker catches up in batches; overflow drops frames explicitly
+        # instead of backing up the connection
+        self._queue = asyncio.Queue(maxsize=10000)
+        await asyncio.gather(self._recv_loop(), self._drain_loop())
+
+    async def _recv_loop(self):
         uri = f"wss://fstream.binance.com/ws/{self.active_symbol}@forceOrder"
         
         # SSL Context to avoid cert errors
@@ -62,73 +120,137 @@ class LiquidationMonitor:
         
         while self.running:
             try:
-                async with websockets.connect(uri, ssl=ssl_context) as websocket:
-                    while self.running:
-                        try:
-                            # Use wait_for to allow checking self.running periodically
-                            msg = await asyncio.wait_for(websocket.recv(), timeout=1.0)
-                            data = json.loads(msg)
-                            self._process_message(data)
-                        except asyncio.TimeoutError:
-                            continue
-                        except Exception as e:
-                            # print(f"WS Error: {e}")
-                            break
+                # Library ping/pong detects dead connections; no need to wake
+                # up every second just to re-check self.running
+                async with websockets.connect(uri, ssl=ssl_context,
+                                              ping_interval=20, ping_timeout=20) as websocket:
+                    stop_task = asyncio.ensure_future(self._stop_event.wait())
+                    try:
+                        while self.running:
+                            recv_task = asyncio.ensure_future(websocket.recv())
+                            done, _ = await asyncio.wait(
+                                (recv_task, stop_task),
+                                return_when=asyncio.FIRST_COMPLETED)
+                            if stop_task in done:
+                                recv_task.cancel()
+                                return
+                            try:
+                                msg = recv_task.result()
+                            except Exception as e:
+                                # print(f"WS Error: {e}")
+                                break
+                            try:
+                                self._queue.put_nowait(msg)
+                            except asyncio.QueueFull:
+                                self.dropped += 1
+                    finally:
+                        stop_task.cancel()
             except Exception as e:
                 # print(f"Connection Error: {e}")
                 await asyncio.sleep(5) # Retry delay
 
-    def _process_message(self, data):
+    async def _drain_loop(self):
+        stop_task = asyncio.ensure_future(self._stop_event.wait())
+        try:
+            while True:
+                get_task = asyncio.ensure_future(self._queue.get())
+                done, _ = await asyncio.wait(
+                    (get_task, stop_task),
+                    return_when=asyncio.FIRST_COMPLETED)
+                if get_task not in done:
+                    get_task.cancel()
+                    return
+                batch = [get_task.result()]
+                while len(batch) < 256:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                events = []
+                for msg in batch:
+                    try:
+                        event = self._parse_frame(msg)
+                    except Exception:
+                        # One malformed/truncated frame must not escape and
+                        # kill the listener; skip it and keep draining
+                        continue
+                    if event:
+                        events.append(event)
+                if events:
+                    self._apply_events(events)
+        finally:
+            stop_task.cancel()
+
+    def _parse_frame(self, msg):
         # Format: {"e":"forceOrder", "o": { ... }}
-        if data.get('e') == 'forceOrder':
-            order = data['o']
-            event = {
-                "time": data['E'], # Event time
-                "side": order['S'], # SELL (Long Liq) or BUY (Short Liq)
-                "qty": float(order['q']),
-                "price": float(order['p']),
-                "amount": float(order['q']) * float(order['p'])
-            }
-            with self.lock:
-                self.liquidations.append(event)
+        # msg is the raw frame (str or bytes); decode here so the parser
+        # choice stays in one place
+        data = orjson.loads(msg) if orjson else json.loads(msg)
+        if data.get('e') != 'forceOrder':
+            return None
+        order = data['o']
+        # Convert each numeric field exactly once; this runs per frame
+        # at whatever rate the stream bursts to
+        qty = float(order['q'])
+        price = float(order['p'])
+        # (event time, side code, qty, price, notional);
+        # side: SELL = long liquidation, BUY = short liquidation
+        return (data['E'], 1 if order['S'] == 'SELL' else 0, qty, price, qty * price)
 
-    def get_stats(self):
+    def _apply_events(self, events):
+        # One lock acquisition per batch instead of per event
         with self.lock:
-            if not self.liquidations:
-                return {
-                    "count": 0, 
-                    "vol": 0, 
-                    "long_vol": 0, 
-                    "short_vol": 0, 
-                    "duration": time.time() - (self.start_time or time.time()),
-                    "start_time": self.start_time
-                }
-            
-            now = time.time()
-            duration = now - self.start_time
-            
-            total_vol = 0
-            long_vol = 0
-            short_vol = 0
-            long_count = 0
-            short_count = 0
-            
-            for liq in self.liquidations:
-                total_vol += liq['amount']
-                if liq['side'] == 'SELL':
-                    long_vol += liq['amount']
-                    long_count += 1
+            for event_time, side, qty, price, amount in events:
+                i = self._head
+                if self._count == self.N:
+                    # Ring is full: subtract the slot being overwritten
+                    old_amount = self._amount[i]
+                    self._total_vol -= old_amount
+                    if self._side[i]:
+                        self._long_vol -= old_amount
+                        self._long_count -= 1
+                    else:
+                        self._short_vol -= old_amount
+                        self._short_count -= 1
+                else:
+                    self._count += 1
+                self._time[i] = event_time
+                self._side[i] = side
+                self._qty[i] = qty
+                self._price[i] = price
+                self._amount[i] = amount
+                self._head = (i + 1) % self.N
+                self._total_vol += amount
+                if side:
+                    self._long_vol += amount
+                    self._long_count += 1
                 else:
-                    short_vol += liq['amount']
-                    short_count += 1
-                    
+                    self._short_vol += amount
+                    self._short_count += 1
+            # One snapshot publish per batch
+            self._publish_snapshot()
+
+    def _process_message(self, msg):
+        event = self._parse_frame(msg)
+        if event:
+            self._apply_events((event,))
+
+    def get_stats(self):
+        # Read the latest published snapshot without taking the writer's
+        # lock; during a cascade the poller never stalls the stream
+        snap = self._snapshot
+        if snap["count"] == 0:
             return {
-                "count": len(self.liquidations),
-                "long_count": long_count,
-                "short_count": short_count,
-                "vol": total_vol,
-                "long_vol": long_vol,
-                "short_vol": short_vol,
-                "duration": duration,
+                "count": 0, 
+                "vol": 0, 
+                "long_vol": 0, 
+                "short_vol": 0, 
+                "duration": time.time() - (self.start_time or time.time()),
                 "start_time": self.start_time
             }
+        
+        return {
+            **snap,
+            "duration": time.time() - self.start_time,
+            "start_time": self.start_time
+        }
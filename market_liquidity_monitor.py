@@ -1,9 +1,25 @@
 import ccxt
-import pandas as pd
 import numpy as np
 import requests
+import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson (C 实现) 解析 40MB 级 DefiLlama 响应比标准库快数倍; 可选依赖
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 磁盘缓存目录 (与 backtest_engine/exchange_monitor 共用);
+# TVL 最多每小时更新, 缓存期内不必重拉 40MB 响应
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'crypto-alpha-terminal')
+TVL_CACHE_TTL = 3600  # 秒
+
 
 class CryptoRiskMonitor:
     def __init__(self):
@@ -11,6 +27,17 @@ class CryptoRiskMonitor:
         self.deribit_url = "https://www.deribit.com/api/v2/public"
         self.defillama_url = "https://api.llama.fi"
 
+        # 共享连接池: Deribit/DefiLlama 复用 keep-alive 连接, 瞬态 429/5xx 重试
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(
+                total=2, backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(['GET'])
+            )
+        ))
+
     def get_market_volatility_and_volume(self, symbol: str = 'BTC/USDT', lookback_days: int = 30):
         """
         来源: Binance
@@ -19,20 +46,23 @@ class CryptoRiskMonitor:
         2. Volume Spike (今日交易量 vs 过去 N 天均值)
         """
         try:
-            # 获取日线数据
+            # 获取日线数据; 31 行定型数据直接上 ndarray,
+            # 省掉 DataFrame/Series 的构造与 NaN 处理开销
             ohlcv = self.binance.fetch_ohlcv(symbol, timeframe='1d', limit=lookback_days + 1)
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+            arr = np.asarray(ohlcv, dtype=np.float64)
+            close = arr[:, 4]
+            volume = arr[:, 5]
             
-            # 计算 Log Returns
-            df['log_ret'] = np.log(df['close'] / df['close'].shift(1))
+            # 计算 Log Returns (相邻切片相除, 无 shift 产生的 NaN)
+            log_ret = np.log(close[1:] / close[:-1])
             
             # 1. Realized Volatility (Annualized)
-            # 标准差 * sqrt(365)
-            realized_vol = df['log_ret'].std() * np.sqrt(365) * 100
+            # 标准差 * sqrt(365); ddof=1 与 pandas 的样本标准差一致
+            realized_vol = log_ret.std(ddof=1) * np.sqrt(365) * 100
             
             # 2. Volume Anomaly
-            current_vol = df['volume'].iloc[-1]
-            avg_vol = df['volume'].iloc[:-1].mean()
+            current_vol = volume[-1]
+            avg_vol = volume[:-1].mean()
             vol_ratio = current_vol / avg_vol if avg_vol > 0 else 0
             
             return {
@@ -50,33 +80,32 @@ class CryptoRiskMonitor:
         指标: +/- 2% 深度 (流动性枯竭监测)
         """
         try:
-            # 获取 Order Book
+            # 获取 Order Book; 500 档直接转成 (N,2) ndarray 做向量化归约
             book = self.binance.fetch_order_book(symbol, limit=500)
-            mid_price = (book['bids'][0][0] + book['asks'][0][0]) / 2
+            bids = np.asarray(book['bids'], dtype=np.float64)
+            asks = np.asarray(book['asks'], dtype=np.float64)
+            mid_price = (bids[0, 0] + asks[0, 0]) / 2
             
-            # 计算深度
-            bids_depth = sum([x[1] for x in book['bids'] if x[0] >= mid_price * (1 - depth_pct)])
-            asks_depth = sum([x[1] for x in book['asks'] if x[0] <= mid_price * (1 + depth_pct)])
+            # 计算深度 (布尔掩码求和, 无 Python 级逐档循环)
+            bids_depth = bids[bids[:, 0] >= mid_price * (1 - depth_pct), 1].sum()
+            asks_depth = asks[asks[:, 0] <= mid_price * (1 + depth_pct), 1].sum()
             
             # 计算滑点模拟 (假设买入 1M USDT)
-            # 简易计算：查看消耗 1M USDT 后的价格偏离度
+            # 累计成本 + searchsorted 定位吃单终点, 替代逐档累加
             target_amount = 1000000  # 100k -> 1M
-            cost = 0
-            filled_qty = 0
             slippage = 0
             
-            # 简单滑点估算逻辑 (Ask side)
-            current_p = 0
-            for price, qty in book['asks']:
-                if cost + (price * qty) >= target_amount:
-                    needed = (target_amount - cost) / price
-                    filled_qty += needed
-                    cost += needed * price
-                    current_p = price
-                    break
-                else:
-                    cost += price * qty
-                    filled_qty += qty
+            cum_cost = np.cumsum(asks[:, 0] * asks[:, 1])
+            idx = np.searchsorted(cum_cost, target_amount)
+            if idx >= len(asks):
+                # 盘口太浅, 整本吃完也不够: 按全部成交计算
+                cost = cum_cost[-1]
+                filled_qty = asks[:, 1].sum()
+            else:
+                prev_cost = cum_cost[idx - 1] if idx > 0 else 0.0
+                needed = (target_amount - prev_cost) / asks[idx, 0]
+                filled_qty = asks[:idx, 1].sum() + needed
+                cost = target_amount
             
             if cost > 0:
                 avg_price = cost / filled_qty
@@ -101,7 +130,7 @@ class CryptoRiskMonitor:
             url = f"{self.deribit_url}/get_index_price"
             # index_name: btcdvol_usdc
             params = {"index_name": f"{currency.lower()}dvol_usdc"}
-            resp = requests.get(url, params=params).json()
+            resp = self.session.get(url, params=params, timeout=(2.0, 5.0)).json()
             
             if 'result' in resp:
                 dvol_value = resp['result'].get('index_price')
@@ -116,19 +145,43 @@ class CryptoRiskMonitor:
         指标: TVL Change (监测流动性撤出)
         """
         try:
-            # Try DefiLlama first
-            url = f"{self.defillama_url}/protocol/{protocol_slug}"
-            # Increase timeout to 30s as the response is large (40MB+)
-            resp = requests.get(url, proxies={"http": None, "https": None}, timeout=30).json()
-            
-            tvl_data = resp.get('tvl', [])
+            # TTL 内直接读磁盘里裁剪过的 tvl 尾部, 不再重拉 40MB 响应
+            cache_path = os.path.join(CACHE_DIR, f"tvl_{protocol_slug}.json")
+            tvl_data = None
+            try:
+                if time.time() - os.path.getmtime(cache_path) < TVL_CACHE_TTL:
+                    with open(cache_path, 'rb') as f:
+                        raw = f.read()
+                    tvl_data = orjson.loads(raw) if orjson else json.loads(raw)
+            except (OSError, ValueError):
+                pass  # 无缓存或缓存损坏, 走网络
+
+            if tvl_data is None:
+                # Try DefiLlama first
+                url = f"{self.defillama_url}/protocol/{protocol_slug}"
+                # Increase timeout to 30s as the response is large (40MB+)
+                response = self.session.get(url, proxies={"http": None, "https": None}, timeout=(2.0, 30.0))
+                resp = orjson.loads(response.content) if orjson else response.json()
+                
+                # 立即只留最后 8 个点, 让 40MB 的完整解析结果尽快被回收
+                tvl_data = resp.get('tvl', [])[-8:]
+                del resp
+
+                try:
+                    os.makedirs(CACHE_DIR, exist_ok=True)
+                    with open(cache_path, 'wb') as f:
+                        f.write(orjson.dumps(tvl_data) if orjson
+                                else json.dumps(tvl_data).encode('utf-8'))
+                except OSError:
+                    pass  # 缓存写失败不影响本次结果
+
             if len(tvl_data) < 2:
                 return {"error": "Insufficient TVL data"}
             
             current_tvl = tvl_data[-1]['totalLiquidityUSD']
             prev_tvl_24h = tvl_data[-2]['totalLiquidityUSD']
-            # 获取7天前数据
-            prev_tvl_7d = tvl_data[-8]['totalLiquidityUSD'] if len(tvl_data) >= 8 else tvl_data[0]['totalLiquidityUSD']
+            # 获取7天前数据 (不足 8 个点时取最早的一个)
+            prev_tvl_7d = tvl_data[0]['totalLiquidityUSD']
             
             change_24h = (current_tvl - prev_tvl_24h) / prev_tvl_24h * 100
             change_7d = (current_tvl - prev_tvl_7d) / prev_tvl_7d * 100
@@ -157,10 +210,18 @@ class CryptoRiskMonitor:
     def execute_dashboard(self):
         print(f"--- Risk Report: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---")
         
+        # 四个指标互相独立且都是 I/O 等待, 并发抓取后总耗时约等于最慢一项;
+        # 每个 getter 自带 try/except, 单项失败不影响其余
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            mkt_f = pool.submit(self.get_market_volatility_and_volume)
+            depth_f = pool.submit(self.get_order_book_depth)
+            iv_f = pool.submit(self.get_implied_volatility, 'BTC')
+            defi_f = pool.submit(self.get_defi_tvl_risk, 'uniswap-v3')
+            mkt_data, depth_data = mkt_f.result(), depth_f.result()
+            iv_data, defi_data = iv_f.result(), defi_f.result()
+        
         # 1. Market Data (BTC/USDT)
         print("\n[Market & Liquidity - BTC/USDT]")
-        mkt_data = self.get_market_volatility_and_volume()
-        depth_data = self.get_order_book_depth()
         print(f"Realized Vol (30d): {mkt_data.get('realized_vol_30d_annualized')}%")
         print(f"Volume Ratio (vs 30d avg): {mkt_data.get('volume_spike_ratio')}x")
         print(f"Orderbook Depth (+/-2%): {depth_data.get('total_depth_2pct')} BTC")
@@ -168,12 +229,10 @@ class CryptoRiskMonitor:
         
         # 2. Implied Volatility
         print("\n[Derivatives Risk]")
-        iv_data = self.get_implied_volatility('BTC')
         print(f"Deribit DVOL Index: {iv_data.get('implied_volatility_index')}")
 
         # 3. DeFi Risk
         print("\n[DeFi Liquidity Flight - Uniswap V3]")
-        defi_data = self.get_defi_tvl_risk('uniswap-v3')
         print(f"TVL Change (24h): {defi_data.get('tvl_change_24h_pct')}%")
         print(f"Risk Status: {defi_data.get('risk_alert')}")
 
@@ -1,6 +1,10 @@
 import requests
 import pandas as pd
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 
 class MarketSentimentMonitor:
@@ -24,79 +28,109 @@ class MarketSentimentMonitor:
         # 部署上线时设为 None
         self.proxies = None 
 
+        # Fear & Greed 日更, 30 分钟 TTL 内复用上次结果
+        self._fng_cache = (0.0, None)
+
+        # 共享连接池: 多 symbol 并发请求复用 keep-alive 连接
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=16, pool_maxsize=16,
+            max_retries=Retry(total=1, backoff_factor=0.2)
+        ))
+
     def get_fear_and_greed(self):
+        ts, cached = self._fng_cache
+        if cached is not None and time.monotonic() - ts < 1800:
+            return cached
         try:
-            response = requests.get(self.fng_url, timeout=10)
+            response = self.session.get(self.fng_url, timeout=10)
             data = response.json()
             if data['data']:
                 item = data['data'][0]
-                return {
+                result = {
                     'value': int(item['value']),
                     'status': item['value_classification'],
                     'update_time': datetime.fromtimestamp(int(item['timestamp']))
                 }
+                # 只缓存成功结果, 失败下次立即重试
+                self._fng_cache = (time.monotonic(), result)
+                return result
         except: return None
 
     # --- 1. 获取 Binance 数据 ---
+    def _fetch_binance_ls(self, symbol):
+        """单 symbol 多空比; 供线程池并发调用"""
+        try:
+            url = f"{self.binance_fapi}/futures/data/globalLongShortAccountRatio"
+            params = {'symbol': symbol, 'period': '4h', 'limit': 1}
+            res = self.session.get(url, params=params, proxies=self.proxies, timeout=3)
+            if res.status_code == 200:
+                ls_data = res.json()
+                if ls_data: return float(ls_data[0]['longShortRatio'])
+        except: pass
+        return 0
+
     def get_binance_data(self):
         data_map = {}
         try:
-            r = requests.get(f"{self.binance_fapi}/fapi/v1/premiumIndex", proxies=self.proxies, timeout=5)
+            r = self.session.get(f"{self.binance_fapi}/fapi/v1/premiumIndex", proxies=self.proxies, timeout=5)
             if r.status_code != 200: return {} # 被墙了直接返回
             all_premium = r.json()
             premium_map = {item['symbol']: item for item in all_premium}
 
-            for symbol in self.targets:
-                item = premium_map.get(symbol)
-                if not item: continue
-                
-                price = float(item['markPrice'])
-                funding = float(item['lastFundingRate']) * 100
-                ls_ratio = 0
-                try:
-                    url = f"{self.binance_fapi}/futures/data/globalLongShortAccountRatio"
-                    params = {'symbol': symbol, 'period': '4h', 'limit': 1}
-                    res = requests.get(url, params=params, proxies=self.proxies, timeout=3)
-                    if res.status_code == 200:
-                        ls_data = res.json()
-                        if ls_data: ls_ratio = float(ls_data[0]['longShortRatio'])
-                except: pass
-
-                data_map[symbol] = {'Price': price, 'Binance_Funding': funding, 'Binance_LS': ls_ratio}
+            # 多空比逐 symbol 独立请求, 并发抓取免去 5 次串行往返
+            symbols = [s for s in self.targets if s in premium_map]
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                ratios = list(pool.map(self._fetch_binance_ls, symbols))
+
+            for symbol, ls_ratio in zip(symbols, ratios):
+                item = premium_map[symbol]
+                data_map[symbol] = {
+                    'Price': float(item['markPrice']),
+                    'Binance_Funding': float(item['lastFundingRate']) * 100,
+                    'Binance_LS': ls_ratio
+                }
         except: pass
         return data_map
 
     # --- 2. 获取 Bybit 数据 ---
+    def _fetch_bybit_ls(self, symbol):
+        """单 symbol 多空比; 供线程池并发调用"""
+        try:
+            url_ratio = f"{self.bybit_api}/v5/market/account-ratio"
+            r = self.session.get(url_ratio, params={'category':'linear','symbol':symbol,'period':'4h','limit':1}, timeout=3).json()
+            if r['retCode'] == 0 and r['result']['list']:
+                item = r['result']['list'][0]
+                buy = float(item.get('buyRatio', 0))
+                sell = float(item.get('sellRatio', 1))
+                if sell > 0: return round(buy/sell, 2)
+        except: pass
+        return 0
+
     def get_bybit_data(self):
         data_map = {}
-        headers = {'User-Agent': 'Mozilla/5.0'}
         try:
-            # 简单测试连接，如果连 tickers 都拿不到，说明也被墙了
+            # 不带 symbol 的 tickers 一次返回全部 linear 合约, 既当连通性
+            # 探测又免去逐 symbol 的费率请求; 内存里按 symbol 取即可
             url_ticker = f"{self.bybit_api}/v5/market/tickers"
-            test = requests.get(url_ticker, params={'category':'linear','symbol':'BTCUSDT'}, headers=headers, timeout=5)
-            if test.status_code != 200: return {} 
+            r = self.session.get(url_ticker, params={'category': 'linear'}, timeout=5)
+            if r.status_code != 200: return {} # 被墙了直接返回
+            resp = r.json()
+            if resp['retCode'] != 0: return {}
+            ticker_map = {t['symbol']: t for t in resp['result']['list']}
 
-            for symbol in self.targets:
-                # A. 费率 & 价格
-                funding = 0
-                try:
-                    r = requests.get(url_ticker, params={'category':'linear','symbol':symbol}, headers=headers, timeout=3).json()
-                    if r['retCode'] == 0 and r['result']['list']:
-                        funding = float(r['result']['list'][0].get('fundingRate', 0)) * 100
-                except: pass
-
-                # B. 多空比
-                ls_ratio = 0
-                url_ratio = f"{self.bybit_api}/v5/market/account-ratio"
-                try:
-                    r = requests.get(url_ratio, params={'category':'linear','symbol':symbol,'period':'4h','limit':1}, headers=headers, timeout=3).json()
-                    if r['retCode'] == 0 and r['result']['list']:
-                        item = r['result']['list'][0]
-                        buy = float(item.get('buyRatio', 0))
-                        sell = float(item.get('sellRatio', 1))
-                        if sell > 0: ls_ratio = round(buy/sell, 2)
-                except: pass
+            # 只剩多空比需要逐 symbol 请求, 线程池并发抓取
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                ratios = list(pool.map(self._fetch_bybit_ls, self.targets))
 
+            for symbol, ls_ratio in zip(self.targets, ratios):
+                funding = 0
+                ticker = ticker_map.get(symbol)
+                if ticker:
+                    try:
+                        funding = float(ticker.get('fundingRate') or 0) * 100
+                    except ValueError: pass
                 data_map[symbol] = {'Bybit_Funding': funding, 'Bybit_LS': ls_ratio}
         except: pass
         return data_map
@@ -113,7 +147,7 @@ class MarketSentimentMonitor:
         }
         data_map = {}
         try:
-            r = requests.get(url, params=params, timeout=10)
+            r = self.session.get(url, params=params, timeout=10)
             data = r.json()
             for symbol, cg_id in self.cg_mapping.items():
                 if cg_id in data:
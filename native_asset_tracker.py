@@ -11,10 +11,12 @@ Native Asset Tracker - BTC/ETH 原生资产追踪模块
 """
 
 import requests
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 from termcolor import cprint
 
 # ============================================================================
@@ -98,9 +100,25 @@ class NativeAssetStats:
 # BTC 追踪器
 # ============================================================================
 
+def _tx_output_totals(txs: List[Dict]) -> np.ndarray:
+    """按交易汇总输出金额 (satoshi)
+
+    把所有输出摊平成一个数组, 用前缀和做分段求和,
+    替代逐 tx 逐 output 的 Python 双层循环
+    """
+    values = np.fromiter(
+        (out.get("value", 0) for tx in txs for out in tx.get("out", [])),
+        dtype=np.int64)
+    lens = np.fromiter((len(tx.get("out", [])) for tx in txs),
+                       dtype=np.int64, count=len(txs))
+    csum = np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(values)))
+    ends = np.cumsum(lens)
+    return csum[ends] - csum[ends - lens]
+
+
 class BTCTracker:
     """Bitcoin 原生资产追踪"""
-    
+
     def __init__(self):
         self.known_whales = KNOWN_BTC_WHALES
     
@@ -133,20 +151,26 @@ class BTCTracker:
             latest = resp.json()
             block_height = latest["height"]
             
-            # 获取区块详情
-            for i in range(3):  # 最近 3 个区块
-                block_url = f"{BLOCKCHAIN_API}/rawblock/{block_height - i}"
-                block_resp = requests.get(block_url, timeout=15)
-                block = block_resp.json()
-                
-                for tx in block.get("tx", [])[:50]:  # 每个区块检查前 50 笔
-                    total_out = sum(out.get("value", 0) for out in tx.get("out", []))
-                    btc_value = total_out / 100_000_000
-                    
-                    if btc_value >= min_btc:
+            # 获取区块详情: 3 个区块互不依赖, 线程池并发抓取,
+            # 总耗时从 3 次往返降到约 1 次往返; 处理仍按高度从新到旧
+            def _fetch_block(height):
+                block_url = f"{BLOCKCHAIN_API}/rawblock/{height}"
+                return requests.get(block_url, timeout=15).json()
+
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                blocks = list(pool.map(
+                    _fetch_block, (block_height - i for i in range(3))))
+
+            for block in blocks:  # 最近 3 个区块
+                txs = block.get("tx", [])[:50]  # 每个区块检查前 50 笔
+                if txs:
+                    # 输出金额汇总走 NumPy 分段求和, 再按阈值筛出大额交易
+                    totals = _tx_output_totals(txs)
+                    for i in np.nonzero(totals >= min_btc * 100_000_000)[0]:
+                        tx = txs[i]
                         large_txs.append({
                             "hash": tx["hash"],
-                            "btc": btc_value,
+                            "btc": totals[i] / 100_000_000,
                             "time": datetime.fromtimestamp(tx["time"]),
                             "inputs": len(tx.get("inputs", [])),
                             "outputs": len(tx.get("out", []))
@@ -161,18 +185,32 @@ class BTCTracker:
         return large_txs[:10]
     
     def get_whale_balances(self) -> List[Dict]:
-        """获取已知鲸鱼地址的当前余额"""
+        """获取已知鲸鱼地址的当前余额
+
+        balance 端点支持 | 分隔的多地址批量查询,
+        一次请求拿到全部余额, 替代逐地址串行轮询
+        """
         results = []
-        
+
+        try:
+            joined = "|".join(self.known_whales)
+            url = f"{BLOCKCHAIN_API}/balance?active={joined}"
+            resp = requests.get(url, timeout=15)
+            data = resp.json()
+        except Exception as e:
+            cprint(f"[Error] BTC balance query: {e}", "red")
+            return results
+
         for address, label in self.known_whales.items():
-            balance = self.get_address_balance(address)
-            if balance is not None and balance > 1.0:  # 过滤掉余额过小的地址
+            satoshis = data.get(address, {}).get("final_balance", 0)
+            balance = satoshis / 100_000_000
+            if balance > 1.0:  # 过滤掉余额过小的地址
                 results.append({
                     "address": address[:20] + "...",
                     "label": label,
                     "balance_btc": balance
                 })
-        
+
         return sorted(results, key=lambda x: x["balance_btc"], reverse=True)
     
     def get_stats_from_api(self) -> Dict:
@@ -543,18 +543,22 @@ def _classify_sentiment(text: str) -> tuple:
         return "neutral", []
 
 
-def get_regulatory_news(project_name: str, max_items: int = 30) -> List[NewsItem]:
+def iter_regulatory_news(project_name: str, max_items: int = 30):
     """
-    Fetch and classify news from RSS feeds.
+    Stream classified news items as each RSS feed is scanned.
+    
+    Generator sibling of get_regulatory_news: project-specific items are
+    yielded as soon as their feed is parsed (fetch order, no cross-feed
+    sort), so callers can render the first article after one round-trip.
     
     Args:
         project_name: Name of the project to search for
-        max_items: Maximum number of news items to return
+        max_items: Maximum number of news items to yield
         
-    Returns:
-        List of NewsItem dataclasses with sentiment classification
+    Yields:
+        NewsItem dataclasses with sentiment classification
     """
-    all_news = []
+    yielded = 0
     general_news = []  # Fallback for general crypto news
     
     # Get all search terms for the project
@@ -619,7 +623,9 @@ def get_regulatory_news(project_name: str, max_items: int = 30) -> List[NewsItem
                 )
                 
                 if is_project_related:
-                    all_news.append(news_item)
+                    if yielded < max_items:
+                        yielded += 1
+                        yield news_item
                 else:
                     # Collect general crypto news as fallback
                     general_news.append(news_item)
@@ -632,7 +638,7 @@ def get_regulatory_news(project_name: str, max_items: int = 30) -> List[NewsItem
             continue
     
     # If few/no project-specific news from RSS, try Google News (longer time range)
-    if len(all_news) < 5:
+    if yielded < 5:
         cprint(f"  🔍 Searching Google News for more {project_name} articles...", "cyan")
         try:
             # Use the main project name for Google News search
@@ -677,20 +683,37 @@ def get_regulatory_news(project_name: str, max_items: int = 30) -> List[NewsItem
                         matched_keywords=matched_keywords,
                         is_project_specific=True
                     )
-                    all_news.append(news_item)
+                    if yielded < max_items:
+                        yielded += 1
+                        yield news_item
                     
         except Exception as e:
             cprint(f"  ⚠️ Google News error: {e}", "yellow")
     
     # If still no project-specific news, include general crypto news
-    if len(all_news) == 0 and len(general_news) > 0:
+    if yielded == 0 and len(general_news) > 0:
         cprint(f"  ℹ️ No {project_name}-specific news, showing general crypto news", "yellow")
         # Sort general news: negative first, then positive, then neutral
         general_news.sort(key=lambda x: (
             0 if x.sentiment == "negative" else (1 if x.sentiment == "positive" else 2),
             x.published
         ), reverse=True)
-        all_news = general_news[:max_items]
+        for news_item in general_news[:max_items]:
+            yield news_item
+
+
+def get_regulatory_news(project_name: str, max_items: int = 30) -> List[NewsItem]:
+    """
+    Fetch and classify news from RSS feeds.
+    
+    Args:
+        project_name: Name of the project to search for
+        max_items: Maximum number of news items to return
+        
+    Returns:
+        List of NewsItem dataclasses with sentiment classification
+    """
+    all_news = list(iter_regulatory_news(project_name, max_items))
     
     # Sort: project-specific first, then by sentiment priority (negative > positive > neutral)
     all_news.sort(key=lambda x: (
@@ -706,7 +729,7 @@ def get_regulatory_news(project_name: str, max_items: int = 30) -> List[NewsItem
     neu_count = sum(1 for n in all_news if n.sentiment == "neutral")
     cprint(f"  📈 Sentiment: {pos_count} positive, {neg_count} negative, {neu_count} neutral", "cyan")
     
-    return all_news[:max_items]
+    return all_news
 
 
 # ============================================================================
@@ -879,7 +902,8 @@ def analyze_project_compliance(
     project_name: str,
     github_owner: Optional[str] = None,
     github_repo: Optional[str] = None,
-    github_token: Optional[str] = None
+    github_token: Optional[str] = None,
+    news_items: Optional[List[NewsItem]] = None
 ) -> Dict:
     """
     Perform comprehensive compliance risk analysis for a project.
@@ -889,6 +913,8 @@ def analyze_project_compliance(
         github_owner: Optional GitHub owner (auto-lookup if not provided)
         github_repo: Optional GitHub repo (auto-lookup if not provided)
         github_token: Optional GitHub token for higher rate limits
+        news_items: Optional pre-fetched news (e.g. streamed via
+            iter_regulatory_news) to skip the internal news scan
         
     Returns:
         Dict with all analysis results
@@ -900,27 +926,40 @@ def analyze_project_compliance(
         "timestamp": datetime.utcnow().isoformat()
     }
     
-    # 1. GitHub Activity
     if not github_owner or not github_repo:
         github_owner, github_repo = lookup_github_repo(project_name)
-    
-    if github_owner and github_repo:
-        cprint(f"  📊 Fetching GitHub activity for {github_owner}/{github_repo}...", "cyan")
-        github_activity = get_github_activity(github_owner, github_repo, github_token)
-        results["github"] = github_activity
-    else:
-        cprint(f"  ⚠️ No GitHub repo found for {project_name}", "yellow")
-        results["github"] = None
-    
-    # 2. DefiLlama Audit Status
-    cprint(f"  🔐 Fetching audit status from DefiLlama...", "cyan")
-    audit_status = get_defi_audit_status(project_name)
-    results["audit"] = audit_status
-    
-    # 3. Regulatory News
-    cprint(f"  📰 Scanning news for regulatory events...", "cyan")
-    news_items = get_regulatory_news(project_name)
-    results["news"] = news_items
+
+    # GitHub / DefiLlama / news hit independent endpoints, so run all three
+    # in parallel - wall-clock becomes max() of the three instead of the sum
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        if github_owner and github_repo:
+            cprint(f"  📊 Fetching GitHub activity for {github_owner}/{github_repo}...", "cyan")
+            github_future = pool.submit(get_github_activity, github_owner, github_repo, github_token)
+        else:
+            cprint(f"  ⚠️ No GitHub repo found for {project_name}", "yellow")
+            github_future = None
+
+        cprint(f"  🔐 Fetching audit status from DefiLlama...", "cyan")
+        audit_future = pool.submit(get_defi_audit_status, project_name)
+
+        if news_items is None:
+            cprint(f"  📰 Scanning news for regulatory events...", "cyan")
+            news_future = pool.submit(get_regulatory_news, project_name)
+        else:
+            news_future = None
+
+        # 1. GitHub Activity
+        results["github"] = github_future.result() if github_future else None
+
+        # 2. DefiLlama Audit Status
+        results["audit"] = audit_future.result()
+
+        # 3. Regulatory News
+        if news_future is not None:
+            news_items = news_future.result()
+        results["news"] = news_items
     
     # 4. Calculate Risk Score
     risk_score = calculate_risk_score(
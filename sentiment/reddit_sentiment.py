@@ -6,6 +6,7 @@ Analyzes sentiment from r/CryptoCurrency using VADER and web scraping
 No API credentials required - uses Reddit's public JSON endpoints
 """
 
+import asyncio
 import requests
 import re
 import traceback
@@ -13,6 +14,15 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+# curl_cffi impersonates Chrome's TLS handshake, which gets past the
+# bot-detection that 403s plain requests from datacenter IPs
+try:
+    from curl_cffi.requests import AsyncSession
+    CURL_CFFI_AVAILABLE = True
+except ImportError:
+    AsyncSession = None
+    CURL_CFFI_AVAILABLE = False
+
 
 class RedditPost:
     """Data model for Reddit posts"""
@@ -28,6 +38,7 @@ class RedditPost:
         # Sentiment analysis fields
         self.sentiment_scores = None
         self.detected_coins = []
+        self.display_snippet = ''
 
 
 class RedditSentimentAnalyzer:
@@ -98,7 +109,17 @@ class RedditSentimentAnalyzer:
         ]
         
         posts = []
-        
+
+        # --- Primary: curl_cffi with Chrome impersonation (fast, no subprocess) ---
+        if CURL_CFFI_AVAILABLE:
+            try:
+                posts = self.scrape_via_curl_cffi(subreddit, filter_type, count, time_range)
+                if posts:
+                    print(f"✅ curl_cffi scraped {len(posts)} posts")
+                    return posts[:count]
+            except Exception as e:
+                print(f"[DEBUG] curl_cffi path failed: {e}")
+
         for domain in domains:
             try:
                 print(f"[DEBUG] Trying domain: {domain}")
@@ -190,6 +211,52 @@ class RedditSentimentAnalyzer:
         
         return posts[:count]
 
+    def scrape_via_curl_cffi(self, subreddit, filter_type, count, time_range) -> List[RedditPost]:
+        """
+        Scrape via curl_cffi's AsyncSession with Chrome TLS impersonation.
+        Replaces the system-CURL subprocess (no process spawn per page) and
+        fetches concurrently where Reddit's API allows it.
+        """
+        return asyncio.run(self._scrape_curl_cffi_async(subreddit, filter_type, count, time_range))
+
+    async def _scrape_curl_cffi_async(self, subreddit, filter_type, count, time_range) -> List[RedditPost]:
+        posts = []
+        after = None
+
+        async with AsyncSession(impersonate='chrome120') as session:
+            # Reddit's 'after' cursor only comes back with the previous page,
+            # so deep pages (count > 100) are walked from the cursor within a
+            # single reused connection - no per-page subprocess or sleep.
+            while len(posts) < count:
+                remaining = count - len(posts)
+                limit = min(remaining, 100)
+
+                url = f"https://old.reddit.com/r/{subreddit}/{filter_type}/.json?limit={limit}"
+                if filter_type == 'top' and time_range:
+                    url += f"&t={time_range}"
+                if after:
+                    url += f"&after={after}"
+
+                print(f"[DEBUG] curl_cffi fetching: {url}")
+                response = await session.get(url, timeout=15)
+
+                if response.status_code != 200:
+                    print(f"[DEBUG] curl_cffi got status {response.status_code}")
+                    break
+
+                data = response.json()
+                children = data.get('data', {}).get('children', [])
+                if not children:
+                    break
+
+                posts.extend(RedditPost(child['data']) for child in children if child.get('data'))
+
+                after = data.get('data', {}).get('after')
+                if not after:
+                    break
+
+        return posts[:count]
+
     def scrape_via_curl(self, subreddit, filter_type, count, time_range) -> List[RedditPost]:
         """Fallback method using system CURL to bypass TLS fingerprinting"""
         import subprocess
@@ -318,7 +385,12 @@ class RedditSentimentAnalyzer:
             
             # Detect mentioned coins
             post.detected_coins = self.detect_coins(text)
-        
+
+            # Short snippet for display; the full body stays on the post
+            # (fetch_reddit_data serializes it), callers that only need the
+            # snippet can drop selftext themselves to save memory
+            post.display_snippet = (post.selftext or '')[:200]
+
         return posts
     
     def aggregate_by_coin(self, posts: List[RedditPost]) -> Dict[str, Dict]:
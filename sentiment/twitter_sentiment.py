@@ -198,38 +198,27 @@ class TwitterSentimentAnalyzer:
             'raw_scores': scores
         }
 
-    def generate_narrative_summary(self, tweets: List[Dict], api_key: str, provider: str = "OpenAI", base_url: str = None, model_name: str = "gpt-4o") -> str:
-        """
-        Generate a narrative summary of the tweets using an LLM.
-        """
-        if not tweets:
-            return "No tweets available to summarize."
-
-        try:
-            from langchain_openai import ChatOpenAI
-            from langchain_core.prompts import ChatPromptTemplate
-            
-            # Initialize LLM
-            if provider == "DeepSeek-V3":
-                llm = ChatOpenAI(
-                    model=model_name,
-                    openai_api_key=api_key,
-                    openai_api_base=base_url,
-                    temperature=0.7
-                )
-            else: # OpenAI
-                llm = ChatOpenAI(
-                    model=model_name,
-                    openai_api_key=api_key,
-                    temperature=0.7
-                )
-
-            # Prepare tweet text blob
-            # User requested to use ALL tweets (not just top 50) to align with other models
-            # Note: 200 tweets * ~280 chars = ~56k chars, which fits easily in GPT-4o/DeepSeek context (128k)
-            tweets_text = "\n".join([f"- {t['text']}" for t in tweets])
+    def _build_narrative_chain(self, api_key: str, provider: str, base_url: str, model_name: str):
+        """Build the prompt | llm chain shared by the sync and async paths"""
+        from langchain_openai import ChatOpenAI
+        from langchain_core.prompts import ChatPromptTemplate
+        
+        # Initialize LLM
+        if provider == "DeepSeek-V3":
+            llm = ChatOpenAI(
+                model=model_name,
+                openai_api_key=api_key,
+                openai_api_base=base_url,
+                temperature=0.7
+            )
+        else: # OpenAI
+            llm = ChatOpenAI(
+                model=model_name,
+                openai_api_key=api_key,
+                temperature=0.7
+            )
 
-            prompt = ChatPromptTemplate.from_template("""
+        prompt = ChatPromptTemplate.from_template("""
             You are a Senior Crypto Trader & Analyst (Degen/Alpha Hunter). 
             Analyze the following tweets about a specific crypto asset to find "Alpha" and filter out noise.
             
@@ -251,9 +240,67 @@ class TwitterSentimentAnalyzer:
             Tone: Professional but sharp, like a hedge fund internal memo.
             """)
 
-            chain = prompt | llm
-            response = chain.invoke({"tweets_text": tweets_text})
+        return prompt | llm
+
+    @staticmethod
+    def _tweets_blob(tweets: List[Dict]) -> str:
+        # Use ALL tweets (not just top 50) to align with the other models.
+        # Note: 200 tweets * ~280 chars = ~56k chars, fits easily in GPT-4o/DeepSeek context (128k)
+        return "\n".join([f"- {t['text']}" for t in tweets])
+
+    def generate_narrative_summary(self, tweets: List[Dict], api_key: str, provider: str = "OpenAI", base_url: str = None, model_name: str = "gpt-4o") -> str:
+        """
+        Generate a narrative summary of the tweets using an LLM.
+        """
+        if not tweets:
+            return "No tweets available to summarize."
+
+        try:
+            chain = self._build_narrative_chain(api_key, provider, base_url, model_name)
+            response = chain.invoke({"tweets_text": self._tweets_blob(tweets)})
+            return response.content
+            
+        except Exception as e:
+            return f"❌ Failed to generate summary: {str(e)}"
+
+    async def agenerate_narrative_summary(self, tweets: List[Dict], api_key: str, provider: str = "OpenAI", base_url: str = None, model_name: str = "gpt-4o") -> str:
+        """
+        Async sibling of generate_narrative_summary (non-blocking ainvoke).
+        """
+        if not tweets:
+            return "No tweets available to summarize."
+
+        try:
+            chain = self._build_narrative_chain(api_key, provider, base_url, model_name)
+            response = await chain.ainvoke({"tweets_text": self._tweets_blob(tweets)})
             return response.content
             
         except Exception as e:
             return f"❌ Failed to generate summary: {str(e)}"
+
+    async def generate_narrative_summaries_batch(
+        self,
+        tweet_batches: List[List[Dict]],
+        api_key: str,
+        provider: str = "OpenAI",
+        base_url: str = None,
+        model_name: str = "gpt-4o",
+        max_concurrency: int = 5
+    ) -> List[str]:
+        """
+        Summarize several assets' tweet batches concurrently.
+        
+        Runs up to max_concurrency LLM calls in flight at once, so N assets
+        cost ~max(latency) instead of sum(latency). Results come back in
+        input order; per-batch failures surface as error strings like the
+        sync path does.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(batch):
+            async with semaphore:
+                return await self.agenerate_narrative_summary(
+                    batch, api_key, provider=provider, base_url=base_url, model_name=model_name
+                )
+
+        return await asyncio.gather(*(_bounded(batch) for batch in tweet_batches))